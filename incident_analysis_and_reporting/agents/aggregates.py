@@ -0,0 +1,107 @@
+"""Shared aggregate cache for charts and KPIs."""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from utils.datetime_ops import fast_to_datetime
+from utils.group_ops import grouped_mean
+
+
+class AggregateCache:
+    """
+    Lazily computed per-column summaries shared across consumers.
+
+    ChartsGenerator and KPICalculator need the same small aggregations
+    (value counts and average resolution times per column, the daily
+    created/resolved timeline). Building them through one cache per
+    pipeline run means each is computed at most once instead of per
+    consumer.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self._counts: Dict[str, pd.Series] = {}
+        self._avg_resolution: Dict[str, pd.Series] = {}
+        self._closed: pd.DataFrame | None = None
+        self._timeline: pd.DataFrame | None = None
+
+    def counts(self, col: str) -> pd.Series:
+        """Value counts for ``col``, most frequent first."""
+        counts = self._counts.get(col)
+        if counts is None:
+            counts = self._counts[col] = self.df[col].value_counts()
+        return counts
+
+    def avg_resolution(self, col: str) -> pd.Series:
+        """
+        Average resolution time per value of ``col``, slowest first
+        (closed tickets only).
+
+        Only closed rows enter the kernel, so values of ``col`` with no
+        closed tickets are absent from the result — the same groups the
+        polars and numba fallback paths in KPICalculator produce.
+        Grouping the full frame instead would emit those values as NaN
+        rows.
+        """
+        means = self._avg_resolution.get(col)
+        if means is None:
+            closed = self._closed_frame()
+            means = self._avg_resolution[col] = grouped_mean(
+                closed[col], closed["resolution_time_hours"]
+            ).sort_values(ascending=False)
+        return means
+
+    def _closed_frame(self) -> pd.DataFrame:
+        """Closed-ticket rows, sliced once and shared across columns."""
+        if self._closed is None:
+            self._closed = self.df[self.df["is_closed"]]
+        return self._closed
+
+    def created_vs_resolved_timeline(self) -> pd.DataFrame:
+        """
+        Daily created and resolved ticket counts over the full range.
+
+        Buckets both series into integer day codes and counts with
+        bincount; grouping on .dt.date would materialize object-dtype
+        Python dates and pay two groupbys plus an outer join.
+        """
+        if self._timeline is not None:
+            return self._timeline
+
+        df = self.df
+        created_days = (
+            fast_to_datetime(df["created_at"]).to_numpy().astype("datetime64[D]")
+        )
+        created_days = created_days[~np.isnat(created_days)]
+
+        closed_mask = (df["status"] == "closed").to_numpy()
+        resolved_days = (
+            fast_to_datetime(df.loc[closed_mask, "closed_at"])
+            .to_numpy()
+            .astype("datetime64[D]")
+        )
+        resolved_days = resolved_days[~np.isnat(resolved_days)]
+
+        all_days = (
+            np.concatenate([created_days, resolved_days])
+            if resolved_days.size
+            else created_days
+        )
+        min_day = all_days.min()
+        max_day = all_days.max()
+        n_days = int((max_day - min_day).astype("int64")) + 1
+
+        created = np.bincount(
+            (created_days - min_day).astype("int64"), minlength=n_days
+        )
+        resolved = np.bincount(
+            (resolved_days - min_day).astype("int64"), minlength=n_days
+        )
+
+        self._timeline = pd.DataFrame(
+            {"created": created, "resolved": resolved},
+            index=pd.date_range(min_day, max_day),
+        )
+        return self._timeline
@@ -1,7 +1,10 @@
 """Data Cleaner Class"""
 
+import numpy as np
 import pandas as pd
 
+from utils.datetime_ops import fast_to_datetime
+
 
 class DataCleaningError(Exception):
     """Custom exception for incident data cleaning errors."""
@@ -10,10 +13,14 @@ class DataCleaningError(Exception):
 class DataCleaner:
     """
     Cleans and enriches support ticket data to prepare it for analysis.
+
+    The cleaner takes ownership of the passed DataFrame and cleans it
+    in place; callers should use the frame returned by :meth:`clean`.
+    Skipping the defensive copy avoids a full-frame memcpy per run.
     """
 
     def __init__(self, df: pd.DataFrame) -> None:
-        self.df = df.copy()
+        self.df = df
 
     def clean(self) -> pd.DataFrame:
         """
@@ -27,9 +34,7 @@ class DataCleaner:
         self._drop_empty_rows()
         self._drop_duplicates()
         self._normalize_text_columns()
-        self._convert_datetime_columns()
-        self._calculate_resolution_times()
-        self._create_status_flags()
+        self._convert_and_enrich()
 
         return self.df
 
@@ -49,25 +54,66 @@ class DataCleaner:
         Normalize text columns:
         - strip whitespace
         - lowercase
+
+        Columns are converted to Arrow-backed strings first so the
+        strip/lower steps run as vectorized Arrow kernels rather than
+        pandas' per-element object-dtype string methods. The result is
+        stored as ``category`` dtype: these columns have few distinct
+        values and are groupby/value_counts targets downstream, so the
+        precomputed codes save a hashtable build per aggregation and
+        halve the memory of the string columns.
         """
         text_columns = ["category", "priority", "status", "agent", "team"]
 
         for col in text_columns:
             if col in self.df.columns:
-                self.df[col] = self.df[col].astype(str).str.strip().str.lower()
-
-    def _convert_datetime_columns(self) -> None:
+                self.df[col] = (
+                    self.df[col]
+                    .astype("string[pyarrow]")
+                    .str.strip()
+                    .str.lower()
+                    .astype("category")
+                )
+
+    def _convert_and_enrich(self) -> None:
         """
-        Convert date columns to datetime.
+        Parse the datetime columns and derive resolution times and
+        status flags in one ``assign``.
+
+        Writing the six columns in a single call avoids one block-
+        manager consolidation per column assignment.
+
+        Tickets without closed_at are considered open and will have
+        NaN resolution times.
         """
         try:
-            self.df["created_at"] = pd.to_datetime(
-                self.df["created_at"], errors="coerce"
-            )
-            self.df["closed_at"] = pd.to_datetime(self.df["closed_at"], errors="coerce")
+            created = fast_to_datetime(self.df["created_at"], errors="coerce")
+            closed = fast_to_datetime(self.df["closed_at"], errors="coerce")
         except KeyError as exc:
             raise DataCleaningError(f"Missing datetime column: {exc}") from exc
 
+        # Single vectorized pass on the raw datetime64 arrays; dividing
+        # the timedelta by one hour yields floats with NaN for open
+        # tickets, skipping the .dt.total_seconds() intermediate.
+        hours = (closed.to_numpy() - created.to_numpy()) / np.timedelta64(1, "h")
+
+        # Invalid resolution times (negative); NaN compares False, so
+        # open tickets are ignored without a separate mask.
+        if np.any(hours < 0):
+            raise DataCleaningError(
+                "Found negative resolution times. Check created_at / closed_at values."
+            )
+
+        is_closed = closed.notna().to_numpy()
+        self.df = self.df.assign(
+            created_at=created,
+            closed_at=closed,
+            resolution_time_hours=hours,
+            resolution_time_days=hours / 24,
+            is_closed=is_closed,
+            is_open=~is_closed,
+        )
+
     def _remove_open_tickets(self) -> None:
         """
         Remove rows where tickets are still open (closed_at is missing).
@@ -82,31 +128,3 @@ class DataCleaner:
         if removed_count > 0:
             print(f"Removed {removed_count} open tickets from dataset")
 
-    def _calculate_resolution_times(self) -> None:
-        """
-        Calculate resolution time in hours and days.
-
-        Tickets without closed_at are considered open and will have
-        NaN resolution times.
-        """
-        self.df["resolution_time_hours"] = (
-            self.df["closed_at"] - self.df["created_at"]
-        ).dt.total_seconds() / 3600
-
-        self.df["resolution_time_days"] = self.df["resolution_time_hours"] / 24
-
-        # Invalid resolution times (negative)
-        invalid_times = self.df["resolution_time_hours"] < 0
-        if invalid_times.any():
-            raise DataCleaningError(
-                "Found negative resolution times. Check created_at / closed_at values."
-            )
-
-    def _create_status_flags(self) -> None:
-        """
-        Create operational flags:
-        - is_open
-        - is_closed
-        """
-        self.df["is_closed"] = self.df["closed_at"].notna()
-        self.df["is_open"] = ~self.df["is_closed"]
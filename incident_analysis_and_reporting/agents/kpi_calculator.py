@@ -1,8 +1,19 @@
 """KPI Calculator Class"""
 
+from functools import cached_property
 from typing import Dict, Any
+
+import numpy as np
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:  # polars is an optional accelerator
+    pl = None
+
+from utils.group_ops import grouped_mean
+from .aggregates import AggregateCache
+
 
 class KPICalculationError(Exception):
     """Custom exception for incident KPI calculation errors."""
@@ -11,10 +22,55 @@ class KPICalculationError(Exception):
 class KPICalculator:
     """
     Calculates operational KPIs from a cleaned incident DataFrame.
+
+    The input frame is only read, never mutated, so it is kept by
+    reference instead of paying a defensive full-frame copy.
     """
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        self.df = df.copy()
+    def __init__(
+        self, df: pd.DataFrame, aggregates: AggregateCache | None = None
+    ) -> None:
+        self.df = df
+        # Shared cache built by the orchestrator; when present, the
+        # grouped summaries charts already computed are reused here.
+        self._agg = aggregates
+
+        # Cache the mask, the closed-row integer index and the
+        # resolution-time array once; the KPI methods would otherwise
+        # re-materialize the same O(N) boolean mask and full-frame
+        # closed slice on every call. Individual columns are gathered
+        # on demand via _closed_col, so no all-column copy is made.
+        self._is_closed = self.df["is_closed"].to_numpy()
+        self._closed_idx = np.flatnonzero(self._is_closed)
+
+        # One scan of the mask yields every ticket count KPI.
+        self._n = len(self.df)
+        self._n_closed = int(self._closed_idx.size)
+        self._n_open = self._n - self._n_closed
+        if "resolution_time_hours" in self.df.columns:
+            self._rt_closed = self.df["resolution_time_hours"].to_numpy(
+                dtype=np.float64
+            )[self._closed_idx]
+        else:
+            self._rt_closed = None
+
+    # Optional Polars fast path: one Arrow conversion lets the grouped
+    # aggregations run on polars' multithreaded engine, with pandas
+    # only reappearing at the return boundary. Built lazily — when the
+    # orchestrator supplies an AggregateCache, every consumer answers
+    # from it and the conversion never happens.
+
+    @cached_property
+    def _pl(self):
+        if pl is None:
+            return None
+        return pl.from_pandas(self.df, rechunk=True)
+
+    @cached_property
+    def _pl_closed(self):
+        if pl is None:
+            return None
+        return self._pl.filter(pl.col("is_closed"))
 
     def calculate_all(self) -> Dict[str, Any]:
         """
@@ -50,84 +106,121 @@ class KPICalculator:
             ) from exc
 
     def _total_tickets(self) -> int:
-        return int(len(self.df))
+        return self._n
 
     def _open_tickets(self) -> int:
-        return int(self.df["is_open"].sum())
+        return self._n_open
 
     def _closed_tickets(self) -> int:
-        return int(self.df["is_closed"].sum())
+        return self._n_closed
 
     def _backlog_percentage(self) -> float:
-        if len(self.df) == 0:
+        if self._n == 0:
             return 0.0
-        return round((self._open_tickets() / len(self.df)) * 100, 2)
+        return round((self._n_open / self._n) * 100, 2)
 
     def _average_resolution_time(self) -> float:
         """
         Average resolution time in hours (closed tickets only).
         """
-        closed_df = self.df[self.df["is_closed"]]
-        if closed_df.empty:
+        if self._rt_closed is None or self._rt_closed.size == 0:
             return 0.0
-        return round(closed_df["resolution_time_hours"].mean(), 2)
+        return round(float(np.mean(self._rt_closed)), 2)
 
     def _median_resolution_time(self) -> float:
         """
         Median resolution time in hours (closed tickets only).
         """
-        closed_df = self.df[self.df["is_closed"]]
-        if closed_df.empty:
+        if self._rt_closed is None or self._rt_closed.size == 0:
             return 0.0
-        return round(closed_df["resolution_time_hours"].median(), 2)
+        return round(float(np.median(self._rt_closed)), 2)
 
-    def _tickets_by_priority(self) -> pd.DataFrame:
-        return (
-            self.df.groupby("priority")
-            .size()
-            .reset_index(name="ticket_count")
-            .sort_values("ticket_count", ascending=False)
+    def _closed_col(self, col: str) -> pd.Series:
+        """Column values for closed tickets, gathered by integer index."""
+        return self.df[col].iloc[self._closed_idx]
+
+    def _count_by(self, col: str) -> pd.DataFrame:
+        """
+        Ticket counts per unique value of ``col``, most frequent first.
+
+        Reuses the shared aggregate cache when available, then the
+        Polars frame, then falls back to np.unique with return_counts;
+        none of these builds a full pandas GroupBy just to count rows.
+        """
+        if self._agg is not None:
+            counts = self._agg.counts(col)
+            return pd.DataFrame(
+                {col: counts.index.to_numpy(), "ticket_count": counts.to_numpy()}
+            )
+
+        if self._pl is not None:
+            return (
+                self._pl.drop_nulls(col)
+                .group_by(col)
+                .agg(pl.len().alias("ticket_count"))
+                .sort("ticket_count", descending=True)
+                .to_pandas()
+            )
+
+        values, counts = np.unique(
+            self.df[col].dropna().to_numpy(), return_counts=True
+        )
+        order = np.argsort(-counts)
+        return pd.DataFrame(
+            {col: values[order], "ticket_count": counts[order]}
         )
 
+    def _tickets_by_priority(self) -> pd.DataFrame:
+        return self._count_by("priority")
+
     def _tickets_by_category(self) -> pd.DataFrame:
-        return (
-            self.df.groupby("category")
-            .size()
-            .reset_index(name="ticket_count")
-            .sort_values("ticket_count", ascending=False)
-        )
+        return self._count_by("category")
 
     def _tickets_by_agent(self) -> pd.DataFrame:
-        return (
-            self.df.groupby("agent")
-            .size()
-            .reset_index(name="ticket_count")
-            .sort_values("ticket_count", ascending=False)
-        )
+        return self._count_by("agent")
 
-    def _resolution_time_by_category(self) -> pd.DataFrame:
+    def _avg_resolution_by(self, col: str) -> pd.DataFrame:
         """
-        Average resolution time by category (closed tickets only).
+        Average resolution time per value of ``col`` (closed tickets
+        only), slowest first.
         """
+        if self._agg is not None:
+            return self._agg.avg_resolution(col).reset_index(
+                name="avg_resolution_time_hours"
+            )
+
+        if self._pl_closed is not None:
+            return (
+                self._pl_closed.group_by(col)
+                .agg(
+                    pl.col("resolution_time_hours")
+                    .mean()
+                    .alias("avg_resolution_time_hours")
+                )
+                .sort("avg_resolution_time_hours", descending=True)
+                .to_pandas()
+            )
+
         return (
-            self.df[self.df["is_closed"]]
-            .groupby("category")["resolution_time_hours"]
-            .mean()
+            grouped_mean(
+                self._closed_col(col),
+                self._closed_col("resolution_time_hours"),
+            )
             .reset_index(name="avg_resolution_time_hours")
             .sort_values("avg_resolution_time_hours", ascending=False)
         )
 
+    def _resolution_time_by_category(self) -> pd.DataFrame:
+        """
+        Average resolution time by category (closed tickets only).
+        """
+        return self._avg_resolution_by("category")
+
     def _resolution_time_by_agent(self) -> pd.DataFrame:
         """
         Average resolution time by agent (closed tickets only).
         """
-        return (
-            self.df[self.df["is_closed"]]
-            .groupby("agent")["resolution_time_hours"]
-            .mean()
-            .reset_index(name="avg_resolution_time_hours")
-            .sort_values("avg_resolution_time_hours", ascending=False)
-        )
+        return self._avg_resolution_by("agent")
 
     def _detect_bottlenecks(self) -> Dict[str, pd.DataFrame]:
         """
@@ -144,23 +237,40 @@ class KPICalculator:
         """
         Calculate SLA compliance rate based on sla_hours column.
         """
-        closed_df = self.df[self.df["is_closed"]]
-        if closed_df.empty or "sla_hours" not in self.df.columns:
-            return 0.0
-        
-        compliant = (closed_df["resolution_time_hours"] <= closed_df["sla_hours"]).sum()
-        total = len(closed_df)
-        
-        if total == 0:
+        if (
+            self._n_closed == 0
+            or self._rt_closed is None
+            or "sla_hours" not in self.df.columns
+        ):
             return 0.0
-        return round((compliant / total) * 100, 1)
+
+        # Single fused compare + popcount on the two aligned arrays.
+        sla = self.df["sla_hours"].to_numpy(dtype=np.float64)[self._closed_idx]
+        compliant = int(np.count_nonzero(self._rt_closed <= sla))
+        return round(compliant * 100.0 / self._n_closed, 1)
 
     def _get_top_category(self) -> str:
         """
         Get the most frequent category.
         """
-        category_counts = self.df["category"].value_counts()
-        return category_counts.index[0] if not category_counts.empty else "N/A"
+        values, counts = np.unique(
+            self.df["category"].dropna().to_numpy(), return_counts=True
+        )
+        return values[np.argmax(counts)] if values.size else "N/A"
+
+    @cached_property
+    def _slowest_categories(self) -> pd.Series:
+        """
+        Average resolution time per category, slowest first, computed
+        once and shared by both slowest-category KPIs.
+        """
+        if self._agg is not None:
+            return self._agg.avg_resolution("category")
+
+        return grouped_mean(
+            self._closed_col("category"),
+            self._closed_col("resolution_time_hours"),
+        ).sort_values(ascending=False)
 
     def _get_slowest_category(self) -> str:
         """
@@ -168,13 +278,8 @@ class KPICalculator:
         """
         if "resolution_time_hours" not in self.df.columns:
             return "N/A"
-        
-        slowest = (
-            self.df[self.df["is_closed"]]
-            .groupby("category")["resolution_time_hours"]
-            .mean()
-            .sort_values(ascending=False)
-        )
+
+        slowest = self._slowest_categories
         return slowest.index[0] if not slowest.empty else "N/A"
 
     def _get_slowest_category_avg(self) -> float:
@@ -183,11 +288,6 @@ class KPICalculator:
         """
         if "resolution_time_hours" not in self.df.columns:
             return 0.0
-        
-        slowest = (
-            self.df[self.df["is_closed"]]
-            .groupby("category")["resolution_time_hours"]
-            .mean()
-            .sort_values(ascending=False)
-        )
+
+        slowest = self._slowest_categories
         return round(slowest.iloc[0], 2) if not slowest.empty else 0.0
\ No newline at end of file
@@ -1,9 +1,11 @@
 """Report exporter"""
 
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -39,6 +41,29 @@ class ReportExporter:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger(__name__)
 
+        # Build the ReportLab styles once; getSampleStyleSheet rebuilds
+        # the full stylesheet on every call.
+        self._styles = getSampleStyleSheet()
+        self._title_style = ParagraphStyle(
+            "CustomTitle",
+            parent=self._styles["Heading1"],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.darkblue,
+            alignment=1,
+        )
+        self._heading_style = ParagraphStyle(
+            "CustomHeading",
+            parent=self._styles["Heading2"],
+            fontSize=16,
+            spaceAfter=12,
+            textColor=colors.darkblue,
+            spaceBefore=20,
+        )
+
+        # Chart image bytes read once and reused across report builds.
+        self._image_bytes: Dict[Path, bytes] = {}
+
     def export_to_pdf(
         self,
         clean_df: pd.DataFrame,
@@ -63,25 +88,9 @@ class ReportExporter:
                 bottomMargin=inch,
             )
 
-            styles = getSampleStyleSheet()
-
-            title_style = ParagraphStyle(
-                "CustomTitle",
-                parent=styles["Heading1"],
-                fontSize=24,
-                spaceAfter=30,
-                textColor=colors.darkblue,
-                alignment=1,
-            )
-
-            heading_style = ParagraphStyle(
-                "CustomHeading",
-                parent=styles["Heading2"],
-                fontSize=16,
-                spaceAfter=12,
-                textColor=colors.darkblue,
-                spaceBefore=20,
-            )
+            styles = self._styles
+            title_style = self._title_style
+            heading_style = self._heading_style
 
             story = []
 
@@ -104,7 +113,9 @@ class ReportExporter:
             story.append(PageBreak())
 
             # Data Overview
-            story.extend(self._build_data_overview(clean_df, heading_style, styles))
+            story.extend(
+                self._build_data_overview(clean_df, kpis, heading_style, styles)
+            )
 
             story.append(PageBreak())
 
@@ -121,6 +132,13 @@ class ReportExporter:
             self.logger.error(error_msg, exc)
             raise PDFExportError(error_msg % exc) from exc
 
+    def _image_reader(self, path: Path) -> io.BytesIO:
+        """Return cached image bytes so each PNG is read from disk once."""
+        data = self._image_bytes.get(path)
+        if data is None:
+            data = self._image_bytes[path] = path.read_bytes()
+        return io.BytesIO(data)
+
     def _build_executive_summary(self, kpis: Dict[str, Any], heading_style, styles):
         elements = []
 
@@ -145,25 +163,30 @@ class ReportExporter:
 
         elements.append(Paragraph("Key Support KPIs", heading_style))
 
-        kpi_data = [
-            ["Metric", "Value"],
-            ["Total Tickets", f"{kpis['total_tickets']}"],
-            ["Average Resolution Time (hrs)", f"{kpis['avg_resolution_time']:.2f}"],
-            ["Median Resolution Time (hrs)", f"{kpis['median_resolution_time']:.2f}"],
-            ["SLA Compliance (%)", f"{kpis['sla_compliance_rate']:.1f}%"],
-            ["Open Tickets", f"{kpis['open_tickets']}"],
-        ]
-
-        if "top_category" in kpis:
-            kpi_data.append(["Most Frequent Category", kpis["top_category"]])
+        # Assemble all rows in one literal; the optional rows use .get
+        # and a single filter instead of conditional appends.
+        top_category = kpis.get("top_category")
+        slowest_category = kpis.get("slowest_category")
 
-        if "slowest_category" in kpis:
-            kpi_data.append(
-                [
+        kpi_data = [
+            row
+            for row in (
+                ("Metric", "Value"),
+                ("Total Tickets", f"{kpis['total_tickets']}"),
+                ("Average Resolution Time (hrs)", f"{kpis['avg_resolution_time']:.2f}"),
+                ("Median Resolution Time (hrs)", f"{kpis['median_resolution_time']:.2f}"),
+                ("SLA Compliance (%)", f"{kpis['sla_compliance_rate']:.1f}%"),
+                ("Open Tickets", f"{kpis['open_tickets']}"),
+                ("Most Frequent Category", top_category),
+                (
                     "Slowest Resolution Category",
-                    f"{kpis['slowest_category']} ({kpis['slowest_category_avg']:.2f} hrs)",
-                ]
+                    f"{slowest_category} ({kpis.get('slowest_category_avg', 0.0):.2f} hrs)"
+                    if slowest_category is not None
+                    else None,
+                ),
             )
+            if row[1] is not None
+        ]
 
         table = Table(kpi_data, colWidths=[3.5 * inch, 2 * inch])
 
@@ -187,17 +210,21 @@ class ReportExporter:
 
         return elements
 
-    def _build_data_overview(self, clean_df: pd.DataFrame, heading_style, styles):
+    def _build_data_overview(
+        self, clean_df: pd.DataFrame, kpis: Dict[str, Any], heading_style, styles
+    ):
         elements = []
 
         elements.append(Paragraph("Ticket Data Overview", heading_style))
 
-        # Show only closed tickets in the PDF table for better overview
-        closed_tickets_df = clean_df[clean_df["closed_at"].notna()]
+        # Show only closed tickets in the PDF table for better overview;
+        # the count is already in the KPIs and only the first 20 closed
+        # rows are needed, so skip materializing the full closed slice.
+        n_closed = kpis["closed_tickets"]
 
         elements.append(
             Paragraph(
-                f"Showing first 20 closed tickets of {len(closed_tickets_df)} resolved tickets (from {len(clean_df)} total):",
+                f"Showing first 20 closed tickets of {n_closed} resolved tickets (from {len(clean_df)} total):",
                 styles["Normal"],
             )
         )
@@ -214,11 +241,19 @@ class ReportExporter:
         ]
 
         # Filter to only available columns
-        available_columns = [
-            col for col in key_columns if col in closed_tickets_df.columns
+        available_columns = [col for col in key_columns if col in clean_df.columns]
+        closed_idx = np.flatnonzero(clean_df["is_closed"].to_numpy())[:20]
+        sample_df = clean_df.iloc[closed_idx][available_columns]
+        # Format column-wise (numeric columns in one np.char.mod call)
+        # and zip into rows, avoiding per-cell Python formatting and the
+        # 2D object-array boxing of values.tolist().
+        columns = [
+            np.char.mod("%.2f", sample_df[col].to_numpy(dtype=np.float64))
+            if col == "resolution_time_hours"
+            else sample_df[col].to_numpy()
+            for col in available_columns
         ]
-        sample_df = closed_tickets_df[available_columns].head(20)
-        data_list = [sample_df.columns.tolist()] + sample_df.values.tolist()
+        data_list = [available_columns] + list(map(list, zip(*columns)))
 
         table = Table(data_list, repeatRows=1)
 
@@ -250,7 +285,7 @@ class ReportExporter:
             elements.append(
                 Paragraph(
                     "No charts available for this report.",
-                    getSampleStyleSheet()["Normal"],
+                    self._styles["Normal"],
                 )
             )
             return elements
@@ -286,8 +321,6 @@ class ReportExporter:
         self, chart1_info, chart2_info, chart_titles, heading_style
     ):
         """Create layout for 1 or 2 charts vertically stacked"""
-        styles = getSampleStyleSheet()
-
         # Build chart data for vertical table layout
         chart_data = []
 
@@ -298,7 +331,9 @@ class ReportExporter:
                 chart_titles.get(chart1_name, chart1_name.replace("_", " ").title()),
                 heading_style,
             )
-            chart1_image = Image(str(chart1_path), width=6 * inch, height=3.5 * inch)
+            chart1_image = Image(
+                self._image_reader(chart1_path), width=6 * inch, height=3.5 * inch
+            )
             chart_data.extend([[chart1_title], [Spacer(1, 10)], [chart1_image]])
 
         # Second chart (if exists)
@@ -312,7 +347,7 @@ class ReportExporter:
                     heading_style,
                 )
                 chart2_image = Image(
-                    str(chart2_path), width=6 * inch, height=3.5 * inch
+                    self._image_reader(chart2_path), width=6 * inch, height=3.5 * inch
                 )
                 chart_data.extend(
                     [[Spacer(1, 20)], [chart2_title], [Spacer(1, 10)], [chart2_image]]
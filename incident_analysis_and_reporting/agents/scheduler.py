@@ -7,6 +7,7 @@ from typing import Any
 import schedule
 
 from utils.logger import get_logger
+from .aggregates import AggregateCache
 from .data_loader import DataLoader
 from .data_cleaner import DataCleaner
 from .charts_generator import ChartsGenerator
@@ -54,28 +55,21 @@ class Scheduler:
             clean_df = cleaner.clean()
             self.logger.info("Data cleaned successfully: %d rows", len(clean_df))
 
+            # Shared aggregate cache reused by KPIs and charts
+            aggregates = AggregateCache(clean_df)
+
             # 3. Calculate KPIs
             self.logger.debug("Step 3: Calculating  KPIs")
-            kpi_calculator = KPICalculator(clean_df)
+            kpi_calculator = KPICalculator(clean_df, aggregates=aggregates)
             kpis = kpi_calculator.calculate_all()
             self.logger.info("KPIs calculated successfully")
 
             # 4. Generate charts
             self.logger.debug("Step 4: Generating charts")
             chart_generator = ChartsGenerator(self.charts_output_dir)
-            charts: dict[str, Any] = {
-                "tickets_by_category": chart_generator.tickets_by_category(clean_df),
-                "tickets_by_priority": chart_generator.tickets_by_priority(clean_df),
-                "avg_resolution_time_by_category": chart_generator.avg_resolution_time_by_category(
-                    clean_df
-                ),
-                "ticket_status_distribution": chart_generator.ticket_status_distribution(
-                    clean_df
-                ),
-                "tickets_created_vs_resolved": chart_generator.tickets_created_vs_resolved(
-                    clean_df
-                ),
-            }
+            charts: dict[str, Any] = chart_generator.generate_all(
+                clean_df, aggregates=aggregates
+            )
             self.logger.info("Charts generated successfully")
 
             # 5. Export PDF report
@@ -0,0 +1,37 @@
+"""Datetime parsing helpers."""
+
+import pandas as pd
+
+
+def fast_to_datetime(series: pd.Series, errors: str = "raise") -> pd.Series:
+    """
+    Parse a Series to datetime, memoizing on unique values.
+
+    Already-datetime input is returned as-is, avoiding a full re-parse.
+    For string input only the distinct values are parsed and then
+    broadcast back with a map, which is far cheaper than parsing every
+    row when values repeat.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Column to parse.
+    errors : str
+        Passed through to ``pd.to_datetime``.
+
+    Returns
+    -------
+    pd.Series
+        Datetime-typed series aligned with the input.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    uniques = series.dropna().unique()
+    if len(uniques) == 0:
+        # All-NaN column (e.g. closed_at when every ticket is still
+        # open): mapping through an empty datetime Series degrades to
+        # float64 and raises, so parse directly to get all-NaT.
+        return pd.to_datetime(series, errors=errors)
+    mapping = pd.Series(pd.to_datetime(uniques, errors=errors), index=uniques)
+    return series.map(mapping)
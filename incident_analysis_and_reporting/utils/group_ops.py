@@ -0,0 +1,50 @@
+"""Numba-accelerated group aggregation helpers."""
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _grouped_sum_count(codes, values, n_groups):
+    """Accumulate per-group sums and counts in a single pass."""
+    sums = np.zeros(n_groups, dtype=np.float64)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    for i in range(codes.shape[0]):
+        code = codes[i]
+        if code >= 0 and not np.isnan(values[i]):
+            sums[code] += values[i]
+            counts[code] += 1
+    return sums, counts
+
+
+def grouped_mean(labels: pd.Series, values: pd.Series) -> pd.Series:
+    """
+    Mean of ``values`` per unique label.
+
+    Equivalent to ``values.groupby(labels).mean()`` but factorizes the
+    labels once and accumulates in a jitted loop, avoiding the per-group
+    dispatch overhead of a pandas groupby.
+
+    Parameters
+    ----------
+    labels : pd.Series
+        Grouping keys (e.g. category, agent).
+    values : pd.Series
+        Numeric values to average.
+
+    Returns
+    -------
+    pd.Series
+        Per-group means indexed by the unique labels.
+    """
+    codes, uniques = pd.factorize(labels.to_numpy())
+    vals = values.to_numpy(dtype=np.float64)
+    sums, counts = _grouped_sum_count(codes, vals, len(uniques))
+    means = np.divide(
+        sums,
+        counts,
+        out=np.full(len(uniques), np.nan),
+        where=counts > 0,
+    )
+    return pd.Series(means, index=pd.Index(uniques, name=labels.name))
@@ -1,81 +1,116 @@
 """Charts Generator"""
 
+from io import BytesIO
 from pathlib import Path
 
+import matplotlib
+
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import pandas as pd
 
+plt.ioff()
+
 
 class ChartGenerator:
     """
     Generates charts for log analysis.
+
+    Rendering always targets the non-interactive Agg backend, and all
+    charts of one generator draw on a single reused Figure, so no GUI
+    state or per-chart figure allocation is involved.
     """
 
     def __init__(self, output_dir: Path) -> None:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._fig = None
 
-    def _save_chart(self, filename: str) -> None:
-        path = self.output_dir / filename
-        plt.tight_layout()
-        plt.savefig(path)
-        plt.close()
-
-    def logs_by_hour(self, df: pd.DataFrame) -> None:
-        plt.figure()
-        plt.plot(df["hour"], df["log_count"])
-        plt.title("Log Volume by Hour")
-        plt.xlabel("Hour")
-        plt.ylabel("Log Count")
-
-        self._save_chart("logs_by_hour.png")
-
-    def errors_by_service(self, df: pd.DataFrame) -> None:
-        plt.figure()
-        plt.bar(df["service"], df["error_count"])
-        plt.title("Errors by Service")
-        plt.xlabel("Service")
-        plt.ylabel("Error Count")
-        plt.xticks(rotation=45, ha="right")
-
-        self._save_chart("errors_by_service.png")
-
-    def log_level_distribution(self, df: pd.DataFrame) -> None:
-        plt.figure()
-        plt.pie(
-            df["count"],
-            labels=df["level"],
-            autopct="%1.1f%%",
-        )
-        plt.title("Log Level Distribution")
+    def _axes(self) -> plt.Axes:
+        """Return a fresh axes on the shared figure."""
+        if self._fig is None:
+            self._fig = plt.figure()
+        self._fig.clear()
+        return self._fig.add_subplot(111)
+
+    def _save_chart(self, filename: str) -> BytesIO:
+        """
+        Encode the current figure once and return the PNG buffer.
+
+        The same bytes are written to the charts directory, so the PDF
+        exporter can embed the buffer without a disk round-trip while
+        the standalone PNG still lands on disk.
+        """
+        self._fig.tight_layout()
+
+        buffer = BytesIO()
+        self._fig.savefig(buffer, format="png")
+        self._fig.clear()
 
-        self._save_chart("log_level_distribution.png")
+        (self.output_dir / filename).write_bytes(buffer.getvalue())
+        buffer.seek(0)
+        return buffer
+
+    def logs_by_hour(self, df: pd.DataFrame) -> BytesIO:
+        ax = self._axes()
+        ax.plot(df["hour"], df["log_count"])
+        ax.set_title("Log Volume by Hour")
+        ax.set_xlabel("Hour")
+        ax.set_ylabel("Log Count")
+
+        return self._save_chart("logs_by_hour.png")
+
+    def errors_by_service(self, df: pd.DataFrame) -> BytesIO:
+        ax = self._axes()
+        ax.bar(df["service"], df["error_count"])
+        ax.set_title("Errors by Service")
+        ax.set_xlabel("Service")
+        ax.set_ylabel("Error Count")
+        ax.tick_params(axis="x", rotation=45)
+
+        return self._save_chart("errors_by_service.png")
+
+    def log_level_distribution(self, df: pd.DataFrame) -> BytesIO:
+        ax = self._axes()
+
+        # Horizontal bars with precomputed percent labels instead of a
+        # pie: no wedge geometry or per-wedge autopct callback, and the
+        # counts stay readable.
+        pct = (df["count"] / df["count"].sum() * 100).round(1)
+
+        bars = ax.barh(df["level"].astype(str), df["count"])
+        ax.bar_label(bars, labels=[f"{p}%" for p in pct])
+        ax.set_title("Log Level Distribution")
+        ax.set_xlabel("Log Count")
+
+        return self._save_chart("log_level_distribution.png")
 
     def volume_anomalies(
         self,
         logs_by_hour: pd.DataFrame,
         anomalies: pd.DataFrame,
-    ) -> None:
-        plt.figure()
-        plt.plot(
+    ) -> BytesIO:
+        ax = self._axes()
+        ax.plot(
             logs_by_hour["hour"],
             logs_by_hour["log_count"],
             label="Log Count",
         )
 
         if not anomalies.empty:
-            plt.scatter(
+            ax.scatter(
                 anomalies["hour"],
                 anomalies["log_count"],
                 label="Anomaly",
             )
 
-        plt.title("Log Volume Anomalies")
-        plt.xlabel("Hour")
-        plt.ylabel("Log Count")
-        plt.legend()
+        ax.set_title("Log Volume Anomalies")
+        ax.set_xlabel("Hour")
+        ax.set_ylabel("Log Count")
+        ax.legend()
 
-        self._save_chart("log_volume_anomalies.png")
+        return self._save_chart("log_volume_anomalies.png")
 
     def run_charts(
         self,
@@ -84,14 +119,23 @@ class ChartGenerator:
         errors_by_service: pd.DataFrame,
         log_level_distribution: pd.DataFrame,
         volume_anomalies: pd.DataFrame,
-    ) -> None:
+    ) -> dict:
         """
         Generate all charts for the log analysis pipeline.
+
+        Returns
+        -------
+        dict
+            Chart name mapped to its in-memory PNG buffer.
         """
-        self.logs_by_hour(logs_by_hour)
-        self.errors_by_service(errors_by_service)
-        self.log_level_distribution(log_level_distribution)
-        self.volume_anomalies(
-            logs_by_hour=logs_by_hour,
-            anomalies=volume_anomalies,
-        )
+        return {
+            "logs_by_hour": self.logs_by_hour(logs_by_hour),
+            "errors_by_service": self.errors_by_service(errors_by_service),
+            "log_level_distribution": self.log_level_distribution(
+                log_level_distribution
+            ),
+            "log_volume_anomalies": self.volume_anomalies(
+                logs_by_hour=logs_by_hour,
+                anomalies=volume_anomalies,
+            ),
+        }
@@ -14,35 +14,55 @@ class DataCleaner:
         """
         Clean and normalize log DataFrame.
 
+        The cleaned columns and the validity mask are computed in one
+        pass and combined in a single assign/loc pipeline, so the
+        inbound frame is never copied up front and peak memory stays at
+        one frame.
+
         Returns
         -------
         pd.DataFrame
             Cleaned DataFrame with normalized fields.
         """
-        df = df.copy()
-
-        df = self._convert_timestamp(df)
-        df = self._normalize_levels(df)
-        df = self._drop_invalid_rows(df)
-
-        return df.reset_index(drop=True)
+        timestamp = pd.to_datetime(df["timestamp"], errors="coerce")
 
-    def _convert_timestamp(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["timestamp"] = pd.to_datetime(
-            df["timestamp"],
-            errors="coerce",
+        # Constraining the categorical to the valid levels maps any
+        # unknown level to NaN, folding the level filter into the mask.
+        level = (
+            df["level"]
+            .astype("string")
+            .str.strip()
+            .str.upper()
+            .astype(pd.CategoricalDtype(sorted(self.VALID_LEVELS)))
         )
-        return df
 
-    def _normalize_levels(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["level"] = df["level"].astype(str).str.strip().str.upper()
-        return df
-
-    def _drop_invalid_rows(self, df: pd.DataFrame) -> pd.DataFrame:
-        required_columns = ["timestamp", "level", "service", "message"]
+        mask = (
+            timestamp.notna()
+            & level.notna()
+            & df["service"].notna()
+            & df["message"].notna()
+        )
 
-        df = df.dropna(subset=required_columns)
+        clean_df = (
+            df.assign(timestamp=timestamp, level=level)
+            .loc[mask]
+            .reset_index(drop=True)
+        )
 
-        df = df[df["level"].isin(self.VALID_LEVELS)]
+        # Precompute the report's 20-row preview while the frame is hot;
+        # the exporter picks it up from attrs instead of re-projecting
+        # columns on every scheduled report run. Stored as plain lists
+        # of strings, not a DataFrame: pandas compares attrs with ==
+        # when propagating them, and a frame-valued attr makes ordinary
+        # operations on the result (astype, merge) raise. The string
+        # form is also JSON-serializable, so it survives to_parquet.
+        preview = clean_df.head(20)[["timestamp", "level", "service", "message"]]
+        clean_df.attrs["preview"] = {
+            "columns": list(preview.columns),
+            "rows": [
+                [str(cell) for cell in row]
+                for row in preview.itertuples(index=False, name=None)
+            ],
+        }
 
-        return df
+        return clean_df
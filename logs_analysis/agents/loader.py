@@ -1,16 +1,66 @@
 """Data Loader"""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List
 
+import numpy as np
 import pandas as pd
 
+COLUMNS = ["timestamp", "level", "service", "message"]
+
+
+def _read_one(path: Path) -> pd.DataFrame:
+    """
+    Parse a single log file with vectorized string splitting.
+
+    Module-level so it can be pickled into worker processes.
+    """
+    raw = pd.Series(
+        path.read_text(encoding="utf-8").splitlines(), dtype="string"
+    ).str.strip()
+
+    # Real file line numbers, captured before invalid lines drop out so
+    # the provenance column survives any skips.
+    line_number = np.arange(1, len(raw) + 1, dtype=np.int32)
+
+    # One vectorized split per file with the remainder folded into the
+    # message field, so pipes inside free-text messages stay intact
+    # (a field-based CSV parse would reject those lines as malformed).
+    parts = raw.str.split("|", n=3, expand=True)
+    if parts.shape[1] < len(COLUMNS):
+        parts = parts.reindex(columns=range(len(COLUMNS)))
+    parts.columns = COLUMNS
+
+    # Blank lines and lines without all four fields are skipped, as in
+    # the per-line parser.
+    valid = parts.notna().all(axis=1)
+    df = parts.loc[valid]
+
+    # One vectorized strip per column instead of per-line cleanup
+    for col in COLUMNS:
+        df[col] = df[col].str.strip()
+
+    df["source_file"] = path.name
+    df["line_number"] = line_number[valid.to_numpy()]
+
+    # Low-cardinality columns as categoricals: one code per row
+    # instead of a PyObject string, and downstream isin/groupby
+    # operate on the integer codes.
+    for col in ("level", "service", "source_file"):
+        df[col] = df[col].astype("category")
+
+    return df
+
 
 class DataLoader:
     """
     Loads and parses log files into a structured DataFrame.
     """
 
+    COLUMNS = COLUMNS
+
     def __init__(self, log_paths: List[Path]) -> None:
         self.log_paths = log_paths
 
@@ -18,6 +68,12 @@ class DataLoader:
         """
         Load and parse all configured log files.
 
+        Each file is split into fields with one vectorized
+        ``str.split`` over all lines instead of a Python loop per line;
+        malformed lines are skipped. With several files, the per-file
+        reads run in a process pool so the parse cost scales across
+        cores instead of summing serially.
+
         Returns
         -------
         pd.DataFrame
@@ -27,45 +83,15 @@ class DataLoader:
             - service (str)
             - message (str)
         """
-        records: list[dict] = []
-
         for path in self.log_paths:
             if not path.exists():
                 raise FileNotFoundError(f"Log file not found: {path}")
 
-            with path.open("r", encoding="utf-8") as file:
-                for line_number, line in enumerate(file, start=1):
-                    parsed = self._parse_line(line.strip(), path, line_number)
-                    if parsed:
-                        records.append(parsed)
-
-        return pd.DataFrame.from_records(records)
-
-    def _parse_line(
-        self,
-        line: str,
-        path: Path,
-        line_number: int,
-    ) -> dict | None:
-        """
-        Parse a single log line.
-        """
-        if not line:
-            return None
-
-        parts = [part.strip() for part in line.split("|", maxsplit=3)]
-
-        if len(parts) != 4:
-            # Invalid or malformed line; skip safely
-            return None
-
-        timestamp, level, service, message = parts
+        if len(self.log_paths) > 1:
+            max_workers = min(len(self.log_paths), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                frames = list(executor.map(_read_one, self.log_paths))
+        else:
+            frames = [_read_one(path) for path in self.log_paths]
 
-        return {
-            "timestamp": timestamp,
-            "level": level,
-            "service": service,
-            "message": message,
-            "source_file": path.name,
-            "line_number": line_number,
-        }
+        return pd.concat(frames, ignore_index=True, copy=False)
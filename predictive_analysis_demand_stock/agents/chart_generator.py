@@ -7,18 +7,109 @@ Generates plots for:
 - Stock-out risk
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
+
 import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 import numpy as np
-from PIL import Image
 
 
 class ChartGeneratorError(Exception):
     """Custom exception for chart generator errors."""
 
 
+# Bar labels are identical for every product chart
+WEEK_LABELS = [f"Week {i}" for i in range(1, 5)] + ["Week 5\n(Forecast)"]
+
+
+def _render_weekly_forecast(
+    output_dir: str,
+    product: str,
+    weeks: list,
+    values: list,
+    bar_colors: list,
+    forecast_color: str,
+    forecast_value: float,
+) -> tuple:
+    """
+    Render one product's weekly sales + forecast bar chart.
+
+    Module-level with plain picklable arguments so it can run inside a
+    worker process; each worker builds and discards its own figure.
+    """
+    fig, ax = plt.subplots(figsize=(8, 6))
+    bars = ax.bar(
+        weeks, values, color=bar_colors, alpha=0.8, edgecolor="black", linewidth=1
+    )
+
+    top = max(values)
+
+    # Add value labels on bars in one batched bar_label call instead of
+    # a text-layout pass per bar
+    ax.bar_label(
+        bars,
+        labels=[str(int(value)) for value in values],
+        padding=3,
+        fontweight="bold",
+        fontsize=10,
+    )
+
+    # Add forecast label
+    if forecast_value > 0:
+        ax.text(
+            4,
+            forecast_value + top * 0.05,
+            "FORECAST",
+            ha="center",
+            va="bottom",
+            fontweight="bold",
+            color=forecast_color,
+            fontsize=9,
+        )
+
+    # Styling
+    ax.set_title(f"Weekly Sales & Forecast - {product}", fontsize=14, fontweight="bold")
+    ax.set_xlabel("Week", fontsize=12)
+    ax.set_ylabel("Units Sold", fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.set_ylim(0, top * 1.2 if top > 0 else 10)
+
+    # Add legend
+    historical_patch = mpatches.Patch(
+        color=bar_colors[0], alpha=0.8, label="Historical"
+    )
+    forecast_patch = mpatches.Patch(
+        color=forecast_color, alpha=0.8, label="Forecast"
+    )
+    ax.legend(
+        handles=[historical_patch, forecast_patch],
+        loc="upper right",
+        framealpha=1,
+    )
+
+    # 150 dpi is plenty for a chart the PDF scales down anyway, and a
+    # low deflate level barely grows these flat-color bar charts while
+    # cutting most of the zlib CPU time.
+    file_path = Path(output_dir) / f"{product}_weekly_forecast.png"
+    fig.savefig(
+        file_path,
+        bbox_inches="tight",
+        dpi=150,
+        pil_kwargs={"compress_level": 1, "optimize": False},
+    )
+    plt.close(fig)
+
+    return product, file_path
+
+
 class ChartGenerator:
     """
     Generates charts for demand analysis and stock risk.
@@ -52,19 +143,24 @@ class ChartGenerator:
             dict of product -> path_to_chart
         """
         charts = {}
+
+        # One figure reused across products: clearing the axes between
+        # iterations skips the per-product figure/canvas construction
+        # that otherwise dominates small batch renders.
+        fig, ax = plt.subplots(figsize=(10, 5))
         for product, group in df.groupby(product_col):
-            plt.figure(figsize=(10, 5))
-            plt.plot(group[date_col], group[sales_col], marker="o")
-            plt.title(f"Historical Demand: {product}")
-            plt.xlabel("Date")
-            plt.ylabel("Quantity Sold")
-            plt.grid(True)
+            ax.clear()
+            ax.plot(group[date_col], group[sales_col], marker="o")
+            ax.set_title(f"Historical Demand: {product}")
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Quantity Sold")
+            ax.grid(True)
 
             file_path = self.output_dir / f"{product}_historical_demand.png"
-            plt.savefig(file_path, bbox_inches="tight")
-            plt.close()
+            fig.savefig(file_path, bbox_inches="tight")
             charts[product] = file_path
 
+        plt.close(fig)
         return charts
 
     def plot_individual_product_forecasts(
@@ -92,107 +188,59 @@ class ChartGenerator:
             .reset_index()
         )
 
-        # Get forecast data
-        forecast_product = forecast_df.copy()
+        # One pivot replaces the four per-product week masks: rows are
+        # products, columns the historical weeks 1-4, missing weeks 0.
+        week_totals = weekly_product.pivot_table(
+            index="product",
+            columns="iso_week",
+            values="quantity_sold",
+            aggfunc="sum",
+            fill_value=0,
+        ).reindex(columns=range(1, 5), fill_value=0)
+
+        # Forecast totals per product, computed once up front
+        forecast_totals = (
+            forecast_df.groupby("product")["forecast_demand"].sum()
+            if forecast_df is not None and len(forecast_df) > 0
+            else pd.Series(dtype=float)
+        )
 
-        # Create chart for each product
+        # Assemble one picklable job per product; all pandas work stays
+        # in this process so the workers only receive plain lists.
+        jobs = []
         for product in weekly_product["product"].unique():
-            # Get historical data for this product
-            product_data = weekly_product[weekly_product["product"] == product]
-
-            # Prepare weeks 1-4 (historical)
-            historical_weeks = []
-            historical_values = []
-
-            for week_num in range(1, 5):  # Weeks 1-4
-                week_data = product_data[product_data["iso_week"] == week_num]
-                if not week_data.empty:
-                    historical_weeks.append(f"Week {week_num}")
-                    historical_values.append(week_data["quantity_sold"].sum())
-                else:
-                    historical_weeks.append(f"Week {week_num}")
-                    historical_values.append(0)
-
-            # Get forecast value for week 5
-            forecast_value = 0
-            if forecast_product is not None and len(forecast_product) > 0:
-                product_forecast = forecast_product[
-                    forecast_product["product"] == product
-                ]
-                if len(product_forecast) > 0:
-                    forecast_value = product_forecast["forecast_demand"].sum()
+            historical_values = week_totals.loc[product].tolist()
+            forecast_value = float(forecast_totals.get(product, 0))
 
             # Combine data
-            weeks = historical_weeks + ["Week 5\n(Forecast)"]
             values = historical_values + [forecast_value]
-            colors = [self.product_colors.get(product, "#1f77b4")] * 4 + [
+            bar_colors = [self.product_colors.get(product, "#1f77b4")] * 4 + [
                 self.forecast_color
             ]
 
-            # Create chart
-            plt.figure(figsize=(8, 6))
-            bars = plt.bar(
-                weeks, values, color=colors, alpha=0.8, edgecolor="black", linewidth=1
-            )
-
-            # Add value labels on bars
-            for bar, value in zip(bars, values):
-                plt.text(
-                    bar.get_x() + bar.get_width() / 2,
-                    bar.get_height() + max(values) * 0.02,
-                    f"{int(value)}",
-                    ha="center",
-                    va="bottom",
-                    fontweight="bold",
-                    fontsize=10,
-                )
-
-            # Add forecast label
-            if forecast_value > 0:
-                plt.text(
-                    4,
-                    forecast_value + max(values) * 0.05,
-                    "FORECAST",
-                    ha="center",
-                    va="bottom",
-                    fontweight="bold",
-                    color=self.forecast_color,
-                    fontsize=9,
+            jobs.append(
+                (
+                    str(self.output_dir),
+                    str(product),
+                    WEEK_LABELS,
+                    [float(v) for v in values],
+                    bar_colors,
+                    self.forecast_color,
+                    forecast_value,
                 )
-
-            # Styling
-            plt.title(
-                f"Weekly Sales & Forecast - {product}", fontsize=14, fontweight="bold"
-            )
-            plt.xlabel("Week", fontsize=12)
-            plt.ylabel("Units Sold", fontsize=12)
-            plt.grid(True, alpha=0.3)
-            plt.ylim(0, max(values) * 1.2 if max(values) > 0 else 10)
-
-            # Add legend
-            import matplotlib.patches as mpatches
-
-            historical_patch = mpatches.Patch(
-                color=self.product_colors.get(product, "#1f77b4"),
-                alpha=0.8,
-                label="Historical",
-            )
-            forecast_patch = mpatches.Patch(
-                color=self.forecast_color, alpha=0.8, label="Forecast"
-            )
-            plt.legend(
-                handles=[historical_patch, forecast_patch],
-                loc="upper right",
-                framealpha=1,
             )
 
-            # Save chart
-            file_path = self.output_dir / f"{product}_weekly_forecast.png"
-            plt.savefig(file_path, bbox_inches="tight", dpi=300)
-            plt.close()
-
-            charts[product] = file_path
-
+        # Each chart renders and encodes independently, so the batch
+        # fans out across worker processes; a single chart is drawn
+        # in-process to skip pool startup.
+        if len(jobs) > 1:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(_render_weekly_forecast, *zip(*jobs))
+        else:
+            results = (_render_weekly_forecast(*job) for job in jobs)
+
+        charts.update(results)
         return charts
 
     def create_combined_product_pages(
@@ -206,36 +254,48 @@ class ChartGenerator:
         Returns:
             dict: {product_name: combined_chart_path}
         """
+        # PIL is only needed for this compositing path, which the
+        # scheduled pipeline does not call; importing it here keeps
+        # module import light.
+        from PIL import Image
+
         combined_charts = {}
 
+        def _pad_to_width(pixels: np.ndarray, width: int, centered: bool) -> np.ndarray:
+            missing = width - pixels.shape[1]
+            if missing == 0:
+                return pixels
+            left = missing // 2 if centered else 0
+            return np.pad(
+                pixels,
+                ((0, 0), (left, missing - left), (0, 0)),
+                constant_values=255,
+            )
+
         for product in weekly_charts.keys():
             if product in stock_charts:
-                # Load images
-                weekly_img = Image.open(weekly_charts[product])
-                stock_img = Image.open(stock_charts[product])
-
-                # Resize images if needed
-                weekly_width, weekly_height = weekly_img.size
-                stock_width, stock_height = stock_img.size
-
-                # Create new image (weekly on top, stock on bottom)
-                combined_width = max(weekly_width, stock_width)
-                combined_height = weekly_height + stock_height + 20  # 20px gap
-
-                combined_img = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
+                # Stack the decoded pixel arrays directly (weekly on
+                # top, stock centered below a white gap); vstack is one
+                # block copy per image versus PIL's canvas-and-paste.
+                weekly_px = np.asarray(Image.open(weekly_charts[product]).convert("RGB"))
+                stock_px = np.asarray(Image.open(stock_charts[product]).convert("RGB"))
+
+                combined_width = max(weekly_px.shape[1], stock_px.shape[1])
+                gap = np.full((20, combined_width, 3), 255, dtype=np.uint8)
+
+                combined_px = np.vstack(
+                    [
+                        _pad_to_width(weekly_px, combined_width, centered=False),
+                        gap,
+                        _pad_to_width(stock_px, combined_width, centered=True),
+                    ]
                 )
 
-                # Paste weekly chart (top)
-                combined_img.paste(weekly_img, (0, 0))
-
-                # Paste stock chart (bottom, centered horizontally if needed)
-                stock_x = (combined_width - stock_width) // 2
-                combined_img.paste(stock_img, (stock_x, weekly_height + 20))
-
                 # Save combined chart
                 combined_path = self.output_dir / f"{product}_combined.png"
-                combined_img.save(combined_path, dpi=(300, 300))
+                Image.fromarray(combined_px).save(
+                    combined_path, dpi=(300, 300), compress_level=1
+                )
                 combined_charts[product] = combined_path
 
         return combined_charts
@@ -253,24 +313,28 @@ class ChartGenerator:
             dict of product -> path_to_chart
         """
         charts = {}
+
+        # Same reuse pattern as plot_historical_demand: one shared
+        # figure, axes cleared per product.
+        fig, ax = plt.subplots(figsize=(10, 5))
         for product, group in forecast_df.groupby(product_col):
-            plt.figure(figsize=(10, 5))
-            plt.plot(
+            ax.clear()
+            ax.plot(
                 group["forecast_period"],
                 group[forecast_col],
                 marker="o",
                 color="orange",
             )
-            plt.title(f"Forecasted Demand: {product}")
-            plt.xlabel("Forecast Period")
-            plt.ylabel("Predicted Quantity")
-            plt.grid(True)
+            ax.set_title(f"Forecasted Demand: {product}")
+            ax.set_xlabel("Forecast Period")
+            ax.set_ylabel("Predicted Quantity")
+            ax.grid(True)
 
             file_path = self.output_dir / f"{product}_forecast.png"
-            plt.savefig(file_path, bbox_inches="tight")
-            plt.close()
+            fig.savefig(file_path, bbox_inches="tight")
             charts[product] = file_path
 
+        plt.close(fig)
         return charts
 
     def plot_stock_risk(
@@ -287,20 +351,27 @@ class ChartGenerator:
             dict of product -> path_to_chart
         """
         charts = {}
-        for _, row in risk_df.iterrows():
-            product = row[product_col]
-            values = [row[stock_col], row[expected_col]]
-            labels = ["Current Stock", "Expected Consumption"]
+        labels = ["Current Stock", "Expected Consumption"]
+
+        # Pull the three columns out as ndarrays once and zip them;
+        # iterrows would box every row into a fresh Series.
+        products = risk_df[product_col].to_numpy()
+        stocks = risk_df[stock_col].to_numpy()
+        expected = risk_df[expected_col].to_numpy()
+
+        fig, ax = plt.subplots(figsize=(6, 4))
+        for product, stock, consumption in zip(products, stocks, expected):
+            values = [stock, consumption]
 
-            plt.figure(figsize=(6, 4))
-            plt.bar(labels, values, color=["green", "red"])
-            plt.title(f"Stock vs Expected Demand: {product}")
-            plt.ylabel("Quantity")
-            plt.grid(axis="y")
+            ax.clear()
+            ax.bar(labels, values, color=["green", "red"])
+            ax.set_title(f"Stock vs Expected Demand: {product}")
+            ax.set_ylabel("Quantity")
+            ax.grid(axis="y")
 
             file_path = self.output_dir / f"{product}_stock_risk.png"
-            plt.savefig(file_path, bbox_inches="tight")
-            plt.close()
+            fig.savefig(file_path, bbox_inches="tight")
             charts[product] = file_path
 
+        plt.close(fig)
         return charts
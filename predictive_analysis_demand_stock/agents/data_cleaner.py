@@ -16,6 +16,12 @@ class DataCleaner:
     def __init__(self, sales_df: pd.DataFrame) -> None:
         self.df = sales_df.copy()
 
+        # Products are low-cardinality; as a categorical the groupby in
+        # _aggregate_by_frequency runs on integer codes instead of
+        # hashing strings per row.
+        if "product" in self.df.columns:
+            self.df["product"] = self.df["product"].astype("category")
+
     def clean(self, frequency: str = "D") -> pd.DataFrame:
         """
         Execute full data cleaning and aggregation pipeline.
@@ -33,39 +39,32 @@ class DataCleaner:
         pd.DataFrame
             Cleaned and aggregated DataFrame.
         """
-        self._convert_date()
-        self._convert_quantity()
-        self._drop_invalid_rows()
+        self._convert_and_filter()
         self._aggregate_by_frequency(frequency)
         self._sort_data()
 
         return self.df
 
-    def _convert_date(self) -> None:
-        """Convert date column to datetime."""
-        try:
-            self.df["date"] = pd.to_datetime(self.df["date"], errors="coerce")
-        except KeyError as exc:
-            raise DataCleaningError("Missing 'date' column") from exc
+    def _convert_and_filter(self) -> None:
+        """
+        Convert date and quantity columns and drop invalid rows.
 
-    def _convert_quantity(self) -> None:
-        """Convert quantity_sold to numeric."""
+        Both conversions and the validity filter (null dates, null or
+        non-positive quantities) are combined into one mask and a single
+        assign/loc pipeline, so the frame is rewritten once instead of
+        in four separate passes.
+        """
         try:
-            self.df["quantity_sold"] = pd.to_numeric(
-                self.df["quantity_sold"], errors="coerce"
-            )
+            dates = pd.to_datetime(self.df["date"], errors="coerce")
+            quantities = pd.to_numeric(self.df["quantity_sold"], errors="coerce")
         except KeyError as exc:
-            raise DataCleaningError("Missing 'quantity_sold' column") from exc
+            raise DataCleaningError(f"Missing {exc} column") from exc
 
-    def _drop_invalid_rows(self) -> None:
-        """
-        Remove rows with:
-        - Null dates
-        - Null quantities
-        - Non-positive quantities
-        """
-        self.df.dropna(subset=["date", "quantity_sold"], inplace=True)
-        self.df = self.df[self.df["quantity_sold"] > 0]
+        # NaN quantities compare False, so the > 0 check also drops the
+        # rows dropna used to remove.
+        mask = dates.notna() & (quantities > 0)
+
+        self.df = self.df.assign(date=dates, quantity_sold=quantities).loc[mask]
 
     def _aggregate_by_frequency(self, frequency: str) -> None:
         """
@@ -74,10 +73,15 @@ class DataCleaner:
         if frequency not in {"D", "W", "M"}:
             raise DataCleaningError("Invalid frequency. Use 'D', 'W', or 'M'.")
 
+        # pd.Grouper folds the per-product resample into one vectorized
+        # groupby pass: no DatetimeIndex round-trip and no Resampler
+        # object per product.
         self.df = (
-            self.df.set_index("date")
-            .groupby("product")
-            .resample(frequency)["quantity_sold"]
+            self.df.groupby(
+                ["product", pd.Grouper(key="date", freq=frequency)],
+                sort=False,
+                observed=True,
+            )["quantity_sold"]
             .sum()
             .reset_index()
         )
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import List
 import pandas as pd
+from pyarrow import csv as pacsv
 
 
 class DataLoaderError(Exception):
@@ -45,8 +46,45 @@ class DataLoader:
         df = self._load_file(self.sales_file)
         df = self._normalize_columns(df)
         self._validate_schema(df, self.SALES_REQUIRED_COLUMNS)
+        # Dictionary-encode the product identifiers once at load time;
+        # every downstream groupby then hashes integer codes instead of
+        # re-hashing the same strings on each pass.
+        df["product"] = df["product"].astype("category")
         return df
 
+    def iter_sales_batches(self, batch_size: int = 1_000_000):
+        """
+        Stream the sales file as validated DataFrame chunks.
+
+        For files too large to materialize at once, pyarrow's streaming
+        CSV reader yields record batches of roughly ``batch_size`` rows;
+        peak memory stays at one batch instead of the whole file. The
+        schema is validated on the first batch only.
+
+        Yields
+        ------
+        pd.DataFrame
+            Normalized and validated chunk of sales rows.
+        """
+        if not self.sales_file.exists():
+            raise DataLoaderError(f"File not found: {self.sales_file}")
+
+        reader = pacsv.open_csv(
+            self.sales_file,
+            read_options=pacsv.ReadOptions(
+                use_threads=True, block_size=max(1 << 16, batch_size * 64)
+            ),
+            convert_options=pacsv.ConvertOptions(timestamp_parsers=["%Y-%m-%d"]),
+        )
+
+        validated = False
+        for batch in reader:
+            df = self._normalize_columns(batch.to_pandas())
+            if not validated:
+                self._validate_schema(df, self.SALES_REQUIRED_COLUMNS)
+                validated = True
+            yield df
+
     def load_stock_data(self) -> pd.DataFrame:
         """
         Load and validate current stock data.
@@ -54,22 +92,45 @@ class DataLoader:
         df = self._load_file(self.stock_file)
         df = self._normalize_columns(df)
         self._validate_schema(df, self.STOCK_REQUIRED_COLUMNS)
+        df["product"] = df["product"].astype("category")
         return df
 
     def _load_file(self, file_path: Path) -> pd.DataFrame:
         """
         Load a CSV or Excel file based on extension.
+
+        Parsed frames are cached as Parquet next to the source file,
+        keyed by its mtime and size, so repeat runs on unchanged inputs
+        skip the CSV/Excel parse entirely. Cache failures fall back to
+        a normal parse.
         """
         if not file_path.exists():
             raise DataLoaderError(f"File not found: {file_path}")
 
         suffix = file_path.suffix.lower()
 
+        cache_path = self._cache_path(file_path)
+        if cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except Exception:
+                cache_path.unlink(missing_ok=True)
+
         try:
             if suffix == ".csv":
-                return pd.read_csv(file_path)
+                # pyarrow's CSV reader parses blocks on multiple threads
+                # and converts ISO dates straight to timestamps, so no
+                # separate to_datetime pass is needed downstream.
+                table = pacsv.read_csv(
+                    file_path,
+                    read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+                    convert_options=pacsv.ConvertOptions(
+                        timestamp_parsers=["%Y-%m-%d"]
+                    ),
+                )
+                df = table.to_pandas()
             elif suffix in {".xlsx", ".xls"}:
-                return pd.read_excel(file_path)
+                df = pd.read_excel(file_path)
             else:
                 raise DataLoaderError(
                     f"Unsupported file format: {suffix}. "
@@ -78,6 +139,27 @@ class DataLoader:
         except Exception as exc:
             raise DataLoaderError(f"Error loading file {file_path}: {exc}") from exc
 
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in cache_path.parent.glob(f"{file_path.stem}_*.parquet"):
+                stale.unlink(missing_ok=True)
+            df.to_parquet(cache_path, compression="zstd")
+        except Exception:
+            # The cache is best-effort; a failed write never fails a load
+            pass
+
+        return df
+
+    @staticmethod
+    def _cache_path(file_path: Path) -> Path:
+        """Cache file keyed by the source's name, mtime and size."""
+        stat = file_path.stat()
+        return (
+            file_path.parent
+            / ".cache"
+            / f"{file_path.stem}_{stat.st_mtime_ns}_{stat.st_size}.parquet"
+        )
+
     @staticmethod
     def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -86,8 +168,13 @@ class DataLoader:
         - Lowercase
         - Replace spaces with underscores
         """
-        df = df.copy()
-        df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+        # One pass over the header instead of three chained str-accessor
+        # calls, each of which allocates an intermediate Index. The
+        # frame comes fresh from _load_file, so relabeling in place is
+        # safe and skips a full-frame copy.
+        df.columns = [
+            column.strip().lower().replace(" ", "_") for column in df.columns
+        ]
         return df
 
     @staticmethod
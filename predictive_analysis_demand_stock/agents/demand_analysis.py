@@ -2,6 +2,11 @@
 
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:  # polars is an optional accelerator
+    pl = None
+
 
 class DemandAnalysisError(Exception):
     """Custom exception for demand analysis errors."""
@@ -10,54 +15,97 @@ class DemandAnalysisError(Exception):
 class DemandAnalysis:
     """
     Performs historical demand analysis per product.
+
+    When polars is installed the aggregations run on its multi-threaded
+    Arrow engine; otherwise the pandas implementations are used.
     """
 
     def __init__(self, sales_df: pd.DataFrame) -> None:
-        self.df = sales_df.copy()
+        # The frame is only ever read, so it is stored as-is; copying
+        # it here would double resident memory for large datasets.
+        self.df = sales_df
 
         if not {"product", "date", "quantity_sold"}.issubset(self.df.columns):
             raise DemandAnalysisError(
                 "DataFrame must contain 'product', 'date', and 'quantity_sold' columns"
             )
 
+        self._pl = (
+            pl.from_pandas(
+                self.df[["product", "date", "quantity_sold"]], rechunk=True
+            )
+            if pl is not None
+            else None
+        )
+        self._summary: pd.DataFrame | None = None
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Per-product demand summary: mean, std, cv and sample count.
+
+        All statistics come out of one groupby traversal of the sales
+        column, and the result is memoized so the per-metric accessors
+        share a single pass.
+        """
+        if self._summary is None:
+            if self._pl is not None:
+                self._summary = (
+                    self._pl.group_by("product")
+                    .agg(
+                        pl.col("quantity_sold").mean().alias("avg_demand"),
+                        pl.col("quantity_sold").std().alias("std_demand"),
+                        (
+                            pl.col("quantity_sold").std()
+                            / pl.col("quantity_sold").mean()
+                        ).alias("cv"),
+                        pl.len().alias("n"),
+                    )
+                    .sort("product")
+                    .to_pandas()
+                )
+            else:
+                grouped = self.df.groupby("product", observed=True)["quantity_sold"]
+                summary = grouped.agg(
+                    avg_demand="mean", std_demand="std", n="size"
+                ).reset_index()
+                summary["cv"] = summary["std_demand"] / summary["avg_demand"]
+                self._summary = summary[
+                    ["product", "avg_demand", "std_demand", "cv", "n"]
+                ]
+
+        return self._summary
+
     def average_demand(self) -> pd.DataFrame:
         """
         Calculate average demand per product.
         """
-        return (
-            self.df.groupby("product")["quantity_sold"]
-            .mean()
-            .reset_index(name="avg_demand")
-        )
+        return self.summary()[["product", "avg_demand"]].copy()
 
     def demand_variability(self) -> pd.DataFrame:
         """
         Calculate demand variability metrics per product.
         """
-        variability = (
-            self.df.groupby("product")["quantity_sold"]
-            .agg(["mean", "std"])
-            .reset_index()
-        )
-
-        variability["cv"] = variability["std"] / variability["mean"]
-
-        return variability.rename(
-            columns={
-                "mean": "avg_demand",
-                "std": "std_demand",
-            }
-        )
+        return self.summary()[["product", "avg_demand", "std_demand", "cv"]].copy()
 
     def seasonality_by_month(self) -> pd.DataFrame:
         """
         Analyze monthly seasonality per product.
         """
-        df = self.df.copy()
-        df["month"] = df["date"].dt.month
+        if self._pl is not None:
+            return (
+                self._pl.with_columns(pl.col("date").dt.month().alias("month"))
+                .group_by(["product", "month"])
+                .agg(pl.col("quantity_sold").mean().alias("avg_monthly_demand"))
+                .sort(["product", "month"])
+                .to_pandas()
+            )
+
+        # Group by the derived month series directly; no copy of the
+        # frame is needed just to attach one temporary column.
+        months = self.df["date"].dt.month.rename("month")
 
         return (
-            df.groupby(["product", "month"])["quantity_sold"]
+            self.df.groupby(["product", months], observed=True)["quantity_sold"]
             .mean()
             .reset_index(name="avg_monthly_demand")
         )
@@ -66,11 +114,21 @@ class DemandAnalysis:
         """
         Analyze weekday seasonality per product.
         """
-        df = self.df.copy()
-        df["weekday"] = df["date"].dt.dayofweek
+        if self._pl is not None:
+            return (
+                self._pl.with_columns(
+                    pl.col("date").dt.weekday().alias("weekday") - 1
+                )
+                .group_by(["product", "weekday"])
+                .agg(pl.col("quantity_sold").mean().alias("avg_weekday_demand"))
+                .sort(["product", "weekday"])
+                .to_pandas()
+            )
+
+        weekdays = self.df["date"].dt.dayofweek.rename("weekday")
 
         return (
-            df.groupby(["product", "weekday"])["quantity_sold"]
+            self.df.groupby(["product", weekdays], observed=True)["quantity_sold"]
             .mean()
             .reset_index(name="avg_weekday_demand")
         )
@@ -7,6 +7,8 @@ Provides simple demand forecasting methods based on historical sales data.
 import pandas as pd
 import numpy as np
 
+from utils.group_ops import grouped_ols
+
 
 class Forecasting:
     """
@@ -29,12 +31,83 @@ class Forecasting:
             product_col: Name of the product identifier column
             sales_col: Name of the sales quantity column
         """
-        self.df = df.copy()
+        # Stored by reference: the engine takes ownership of the frame
+        # and may normalize the date column (and add helper columns) in
+        # place, so callers should not rely on the input afterwards.
+        # Skipping the defensive copy avoids a full-frame memcpy per
+        # run.
+        self.df = df
         self.date_col = date_col
         self.product_col = product_col
         self.sales_col = sales_col
 
-        self.df[self.date_col] = pd.to_datetime(self.df[self.date_col])
+        # The loader's Arrow CSV path already delivers datetime64 dates,
+        # so re-parsing here would walk the whole column for nothing;
+        # only frames from other sources still pay the string parse.
+        if not np.issubdtype(self.df[self.date_col].dtype, np.datetime64):
+            self.df[self.date_col] = pd.to_datetime(
+                self.df[self.date_col], cache=True
+            )
+
+        # One Generator shared by all forecast methods; noise is drawn
+        # in batched arrays instead of one scalar call per step.
+        self._rng = np.random.default_rng()
+
+        # Memoized intermediates shared by the forecast methods, which
+        # all need some mix of the sorted frame, the fitted trend lines
+        # and the per-product/seasonal averages. The sales frame is
+        # treated as immutable once forecasting starts, so the caches
+        # are filled lazily and never invalidated.
+        self._sorted: pd.DataFrame | None = None
+        self._trend_fit: tuple | None = None
+        self._stats: pd.DataFrame | None = None
+        self._seasonal_tables: dict[str, pd.DataFrame] = {}
+
+    # ---------- Shared grouped intermediates ----------
+
+    def _sorted_frame(self) -> pd.DataFrame:
+        """Sales frame sorted by (product, date), computed once."""
+        if self._sorted is None:
+            self._sorted = self.df.sort_values([self.product_col, self.date_col])
+        return self._sorted
+
+    def _fit_trend(self) -> tuple:
+        """Per-product group sizes plus OLS slope/intercept arrays."""
+        if self._trend_fit is None:
+            df_sorted = self._sorted_frame()
+            sizes = df_sorted.groupby(self.product_col, observed=True).size()
+            y = df_sorted[self.sales_col].to_numpy(dtype=np.float64)
+            slope, intercept = grouped_ols(y, sizes.to_numpy())
+            self._trend_fit = (sizes, slope, intercept)
+        return self._trend_fit
+
+    def _product_stats(self) -> pd.DataFrame:
+        """Per-product overall average demand and last observed date."""
+        if self._stats is None:
+            self._stats = self.df.groupby(self.product_col, observed=True).agg(
+                overall_avg=(self.sales_col, "mean"),
+                last_date=(self.date_col, "max"),
+            )
+        return self._stats
+
+    def _seasonal_averages(self, by: str) -> pd.DataFrame:
+        """Mean demand per (product, seasonal period).
+
+        ``by`` selects the period key: "dayofweek" or "day" of month.
+        """
+        if by not in self._seasonal_tables:
+            dates = self.df[self.date_col]
+            key = dates.dt.dayofweek if by == "dayofweek" else dates.dt.day
+            self._seasonal_tables[by] = (
+                self.df.groupby(
+                    [self.product_col, key.rename("seasonal_period")],
+                    observed=True,
+                )[self.sales_col]
+                .mean()
+                .rename("seasonal_avg")
+                .reset_index()
+            )
+        return self._seasonal_tables[by]
 
     def calculate_average_demand(self) -> pd.DataFrame:
         """
@@ -44,7 +117,7 @@ class Forecasting:
             DataFrame with average demand per product
         """
         return (
-            self.df.groupby(self.product_col)[self.sales_col]
+            self.df.groupby(self.product_col, observed=True)[self.sales_col]
             .mean()
             .reset_index()
             .rename(columns={self.sales_col: "avg_demand"})
@@ -68,7 +141,9 @@ class Forecasting:
             raise ValueError("freq must be 'month' or 'week'")
 
         return (
-            self.df.groupby([self.product_col, "period"])[self.sales_col]
+            self.df.groupby([self.product_col, "period"], observed=True)[
+                self.sales_col
+            ]
             .mean()
             .reset_index()
             .rename(columns={self.sales_col: "seasonal_avg_demand"})
@@ -89,26 +164,34 @@ class Forecasting:
         Returns:
             DataFrame with forecasted demand per product
         """
-        forecasts = []
-
-        for product, group in self.df.groupby(self.product_col):
-            group = group.sort_values(self.date_col)
+        # One sort, then everything group-wise happens inside vectorized
+        # groupby kernels: the mean of each product's last `window` rows
+        # (what the trailing rolling mean evaluates to), with groups
+        # shorter than the window falling back to their overall mean.
+        df_sorted = self._sorted_frame()
+        grouped = df_sorted.groupby(self.product_col, observed=True)[self.sales_col]
 
-            rolling_mean = group[self.sales_col].rolling(window=window).mean().values[-1]
-
-            if np.isnan(rolling_mean):
-                rolling_mean = group[self.sales_col].mean()
+        position_from_end = grouped.cumcount(ascending=False)
+        tail_mean = (
+            df_sorted.loc[position_from_end < window]
+            .groupby(self.product_col, observed=True)[self.sales_col]
+            .mean()
+        )
+        rolling_mean = tail_mean.where(grouped.size() >= window, grouped.mean())
 
-            for step in range(1, periods + 1):
-                forecasts.append(
-                    {
-                        self.product_col: product,
-                        "forecast_period": step,
-                        "forecast_demand": round(rolling_mean, 2),
-                    }
-                )
+        # Broadcast each product's value across the forecast horizon
+        # index.repeat keeps the categorical product dtype in the
+        # output frame instead of densifying to Python strings
+        products = rolling_mean.index
+        values = np.round(rolling_mean.to_numpy(dtype=float), 2)
 
-        return pd.DataFrame(forecasts)
+        return pd.DataFrame(
+            {
+                self.product_col: products.repeat(periods),
+                "forecast_period": np.tile(np.arange(1, periods + 1), len(products)),
+                "forecast_demand": np.repeat(values, periods),
+            }
+        )
 
     def trend_forecast(
         self,
@@ -123,48 +206,30 @@ class Forecasting:
         Returns:
             DataFrame with forecasted demand per product
         """
-        forecasts = []
-        
-        for product, group in self.df.groupby(self.product_col):
-            group = group.sort_values(self.date_col)
-            
-            # Prepare data for linear regression
-            X = np.arange(len(group)).reshape(-1, 1)
-            y = group[self.sales_col].values
-            
-            # Calculate linear regression manually
-            n = len(X)
-            X_mean = np.mean(X)
-            y_mean = np.mean(y)
-            
-            # Calculate slope and intercept
-            numerator = np.sum((X.flatten() - X_mean) * (y - y_mean))
-            denominator = np.sum((X.flatten() - X_mean) ** 2)
-            
-            if denominator == 0:
-                slope = 0
-            else:
-                slope = numerator / denominator
-            
-            intercept = y_mean - slope * X_mean
-            
-            # Generate forecast
-            last_index = len(group)
-            for step in range(1, periods + 1):
-                future_index = last_index + step - 1
-                forecast_value = slope * future_index + intercept
-                
-                # Add some realistic variation
-                noise = np.random.normal(0, abs(forecast_value) * 0.1)
-                forecast_value = max(0, forecast_value + noise)
-                
-                forecasts.append({
-                    self.product_col: product,
-                    "forecast_period": step,
-                    "forecast_demand": round(forecast_value, 2),
-                })
-        
-        return pd.DataFrame(forecasts)
+        # After the sort each product's sales form one contiguous block,
+        # so the per-product least-squares fit runs in the jitted
+        # grouped_ols kernel: one pass over the array, groups fitted in
+        # parallel, with no per-product Python regression.
+        sizes, slope, intercept = self._fit_trend()
+        n = sizes.to_numpy(dtype=np.float64)
+
+        # future_index for step s is n + s - 1; broadcast the line over
+        # the whole products × periods grid at once
+        future_index = n[:, None] + np.arange(periods)[None, :]
+        base = slope[:, None] * future_index + intercept[:, None]
+
+        # Add some realistic variation
+        noise = self._rng.standard_normal(base.shape) * np.abs(base) * 0.1
+        forecast = np.round(np.maximum(0.0, base + noise), 2)
+
+        products = sizes.index
+        return pd.DataFrame(
+            {
+                self.product_col: products.repeat(periods),
+                "forecast_period": np.tile(np.arange(1, periods + 1), len(products)),
+                "forecast_demand": forecast.ravel(),
+            }
+        )
 
     def seasonal_forecast(
         self,
@@ -181,50 +246,57 @@ class Forecasting:
         Returns:
             DataFrame with forecasted demand per product
         """
-        forecasts = []
-        
-        for product, group in self.df.groupby(self.product_col):
-            group = group.sort_values(self.date_col)
-            
-            # Calculate seasonal patterns
-            if seasonal_freq == "week":
-                group["seasonal_period"] = group[self.date_col].dt.dayofweek
-            else:  # month
-                group["seasonal_period"] = group[self.date_col].dt.day
-            
-            seasonal_avg = group.groupby("seasonal_period")[self.sales_col].mean()
-            overall_avg = group[self.sales_col].mean()
-            
-            # Generate forecast with seasonal pattern
-            last_date = group[self.date_col].iloc[-1]
-            for step in range(1, periods + 1):
-                future_date = last_date + pd.Timedelta(days=step)
-                
-                if seasonal_freq == "week":
-                    seasonal_period = future_date.dayofweek
-                else:
-                    seasonal_period = future_date.day
-                
-                # Get seasonal factor
-                if seasonal_period in seasonal_avg.index:
-                    seasonal_factor = seasonal_avg[seasonal_period] / overall_avg
-                else:
-                    seasonal_factor = 1.0
-                
-                # Base forecast with seasonal adjustment
-                base_forecast = overall_avg * seasonal_factor
-                
-                # Add realistic variation
-                noise = np.random.normal(0, abs(base_forecast) * 0.15)
-                forecast_value = max(0, base_forecast + noise)
-                
-                forecasts.append({
-                    self.product_col: product,
-                    "forecast_period": step,
-                    "forecast_demand": round(forecast_value, 2),
-                })
-        
-        return pd.DataFrame(forecasts)
+        # Two grouped passes replace the per-product Python loop: one
+        # computing the (product, seasonal period) averages, one the
+        # per-product overall average and last date. The future grid is
+        # then built as products × periods arrays and the seasonal
+        # factor attached with a single merge.
+        seasonal_avg = self._seasonal_averages(
+            "dayofweek" if seasonal_freq == "week" else "day"
+        )
+        stats = self._product_stats()
+
+        products = stats.index
+        steps = np.tile(np.arange(1, periods + 1), len(products))
+
+        future = pd.DataFrame(
+            {
+                self.product_col: products.repeat(periods),
+                "forecast_period": steps,
+            }
+        )
+        future_dates = np.repeat(
+            stats["last_date"].to_numpy(), periods
+        ) + pd.to_timedelta(steps, unit="D")
+        if seasonal_freq == "week":
+            future["seasonal_period"] = future_dates.dayofweek
+        else:
+            future["seasonal_period"] = future_dates.day
+
+        future = future.merge(
+            seasonal_avg, on=[self.product_col, "seasonal_period"], how="left"
+        )
+
+        # Unseen seasonal periods fall back to factor 1.0, i.e. the
+        # overall average
+        overall = np.repeat(stats["overall_avg"].to_numpy(), periods)
+        factor = (future["seasonal_avg"].to_numpy() / overall)
+        factor = np.where(np.isnan(factor), 1.0, factor)
+        base = overall * factor
+
+        # One batched draw for the whole grid; each step scales its
+        # standard-normal sample by that step's base forecast
+        draws = self._rng.standard_normal((len(products), periods)).ravel()
+        noise = draws * np.abs(base) * 0.15
+        forecast = np.round(np.maximum(0.0, base + noise), 2)
+
+        return pd.DataFrame(
+            {
+                self.product_col: future[self.product_col],
+                "forecast_period": future["forecast_period"],
+                "forecast_demand": forecast,
+            }
+        )
 
     def combined_forecast(
         self,
@@ -245,72 +317,66 @@ class Forecasting:
         Returns:
             DataFrame with forecasted demand per product
         """
-        forecasts = []
-        
-        for product, group in self.df.groupby(self.product_col):
-            group = group.sort_values(self.date_col)
-            
-            # Calculate trend component
-            X = np.arange(len(group)).reshape(-1, 1)
-            y = group[self.sales_col].values
-            
-            # Manual linear regression
-            n = len(X)
-            X_mean = np.mean(X)
-            y_mean = np.mean(y)
-            
-            numerator = np.sum((X.flatten() - X_mean) * (y - y_mean))
-            denominator = np.sum((X.flatten() - X_mean) ** 2)
-            
-            if denominator == 0:
-                slope = 0
-            else:
-                slope = numerator / denominator
-            
-            intercept = y_mean - slope * X_mean
-            
-            # Calculate seasonal component
-            group["seasonal_period"] = group[self.date_col].dt.dayofweek
-            seasonal_avg = group.groupby("seasonal_period")[self.sales_col].mean()
-            overall_avg = group[self.sales_col].mean()
-            
-            # Generate forecast
-            last_index = len(group)
-            last_date = group[self.date_col].iloc[-1]
-            
-            for step in range(1, periods + 1):
-                # Trend component
-                future_index = last_index + step - 1
-                trend_component = slope * future_index + intercept
-                
-                # Seasonal component
-                future_date = last_date + pd.Timedelta(days=step)
-                seasonal_period = future_date.dayofweek
-                
-                if seasonal_period in seasonal_avg.index:
-                    seasonal_factor = seasonal_avg[seasonal_period] / overall_avg
-                else:
-                    seasonal_factor = 1.0
-                
-                seasonal_component = overall_avg * seasonal_factor
-                
-                # Noise component
-                noise_component = np.random.normal(0, abs(overall_avg) * 0.2)
-                
-                # Combine components
-                combined_forecast = (
-                    trend_weight * trend_component +
-                    seasonal_weight * seasonal_component +
-                    noise_weight * noise_component
-                )
-                
-                # Ensure non-negative
-                forecast_value = max(0, combined_forecast)
-                
-                forecasts.append({
-                    self.product_col: product,
-                    "forecast_period": step,
-                    "forecast_demand": round(forecast_value, 2),
-                })
-        
-        return pd.DataFrame(forecasts)
\ No newline at end of file
+        # Trend component: the jitted grouped OLS fit shared with
+        # trend_forecast; on a second forecast call every grouped
+        # intermediate below comes straight from the memo caches.
+        sizes, slope, intercept = self._fit_trend()
+        n = sizes.to_numpy(dtype=np.float64)
+
+        stats = self._product_stats()
+        overall_avg = stats["overall_avg"].to_numpy()
+
+        future_index = n[:, None] + np.arange(periods)[None, :]
+        trend_component = (
+            slope[:, None] * future_index + intercept[:, None]
+        ).ravel()
+
+        # Seasonal component: one (product, weekday) average joined onto
+        # the future grid, instead of a per-step dict lookup.
+        seasonal_avg = self._seasonal_averages("dayofweek")
+
+        products = stats.index
+        steps = np.tile(np.arange(1, periods + 1), len(products))
+
+        future = pd.DataFrame(
+            {
+                self.product_col: products.repeat(periods),
+                "forecast_period": steps,
+            }
+        )
+        future_dates = np.repeat(
+            stats["last_date"].to_numpy(), periods
+        ) + pd.to_timedelta(steps, unit="D")
+        future["seasonal_period"] = future_dates.dayofweek
+
+        future = future.merge(
+            seasonal_avg, on=[self.product_col, "seasonal_period"], how="left"
+        )
+
+        overall = np.repeat(overall_avg, periods)
+        factor = future["seasonal_avg"].to_numpy() / overall
+        factor = np.where(np.isnan(factor), 1.0, factor)
+        seasonal_component = overall * factor
+
+        # Noise scale is constant within a group, so the whole grid's
+        # noise comes from one batched draw
+        noise_component = (
+            self._rng.standard_normal((len(products), periods)).ravel()
+            * np.abs(overall)
+            * 0.2
+        )
+
+        combined = (
+            trend_weight * trend_component
+            + seasonal_weight * seasonal_component
+            + noise_weight * noise_component
+        )
+        forecast = np.round(np.maximum(0.0, combined), 2)
+
+        return pd.DataFrame(
+            {
+                self.product_col: future[self.product_col],
+                "forecast_period": future["forecast_period"],
+                "forecast_demand": forecast,
+            }
+        )
\ No newline at end of file
@@ -140,8 +140,17 @@ class Scheduler:
     def _start(self) -> None:
         """
         Start the infinite scheduler loop.
+
+        The loop sleeps exactly until the next due job instead of waking
+        every 60 seconds, so no CPU is burned (and no firing jitter is
+        added) between runs.
         """
         self.logger.info("Stock & Forecast Scheduler started...")
         while True:
             schedule.run_pending()
-            time.sleep(60)
+            idle = schedule.idle_seconds()
+            if idle is None:
+                self.logger.info("No jobs scheduled; stopping scheduler loop")
+                break
+            if idle > 0:
+                time.sleep(idle)
@@ -0,0 +1,113 @@
+"""Numba-accelerated group regression helpers."""
+
+import numpy as np
+from numba import config, njit, prange
+
+# The default OpenMP threading layer leaves the process in a state that
+# hangs at shutdown once the chart stage forks worker processes; the
+# workqueue layer coexists with fork cleanly (no jitted code runs in
+# the forked workers).
+config.THREADING_LAYER = "workqueue"
+
+
+@njit(parallel=True, cache=True)
+def _grouped_ols_pass(offsets, y, slope, intercept):
+    """Least-squares fit per contiguous value block, groups in parallel."""
+    for g in prange(offsets.shape[0] - 1):
+        start = offsets[g]
+        end = offsets[g + 1]
+        n = float(end - start)
+        Sx = 0.0
+        Sy = 0.0
+        Sxx = 0.0
+        Sxy = 0.0
+        for i in range(end - start):
+            x = float(i)
+            yi = y[start + i]
+            Sx += x
+            Sy += yi
+            Sxx += x * x
+            Sxy += x * yi
+        denominator = n * Sxx - Sx * Sx
+        if denominator == 0.0:
+            slope[g] = 0.0
+        else:
+            slope[g] = (n * Sxy - Sx * Sy) / denominator
+        intercept[g] = (Sy - slope[g] * Sx) / n
+
+
+@njit(cache=True)
+def _grouped_sum_pass(codes, values, out):
+    """Accumulate column-wise per-group sums in a single pass."""
+    for i in range(codes.shape[0]):
+        code = codes[i]
+        if code >= 0:
+            for j in range(values.shape[1]):
+                out[code, j] += values[i, j]
+
+
+def grouped_sum(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Column-wise sums of ``values`` per group code.
+
+    Equivalent to a pandas groupby sum over the value columns, but with
+    the labels already factorized to integer codes the jitted loop
+    accumulates all columns in one pass over the rows, skipping the
+    generic hash/take/aggregate machinery.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Integer group code per row (negative codes are skipped).
+    values : np.ndarray
+        2D array of shape (n_rows, n_columns) to sum.
+    n_groups : int
+        Number of distinct groups.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_groups, n_columns) with per-group sums.
+    """
+    out = np.zeros((n_groups, values.shape[1]), dtype=np.float64)
+    _grouped_sum_pass(
+        np.ascontiguousarray(codes, dtype=np.int64),
+        np.ascontiguousarray(values, dtype=np.float64),
+        out,
+    )
+    return out
+
+
+def grouped_ols(values: np.ndarray, group_sizes: np.ndarray):
+    """
+    Slope and intercept of ``y = a*x + b`` fitted per group.
+
+    ``values`` must be ordered so each group's observations form one
+    contiguous block (the frame sorted by group key, then date); x is
+    each observation's 0-based position within its group. The jitted
+    kernel fuses the five sum reductions (n, Sx, Sy, Sxx, Sxy) into a
+    single pass over the array and fits the groups in parallel.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Observations in group-contiguous order.
+    group_sizes : np.ndarray
+        Number of observations per group, in block order.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Per-group slope and intercept arrays.
+    """
+    offsets = np.zeros(len(group_sizes) + 1, dtype=np.int64)
+    np.cumsum(group_sizes, out=offsets[1:])
+    slope = np.empty(len(group_sizes), dtype=np.float64)
+    intercept = np.empty(len(group_sizes), dtype=np.float64)
+    _grouped_ols_pass(
+        offsets,
+        np.ascontiguousarray(values, dtype=np.float64),
+        slope,
+        intercept,
+    )
+    return slope, intercept
@@ -1,7 +1,13 @@
 """Chart Generator Class"""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict
+
+import matplotlib
+
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import pandas as pd
 from logger import get_logger
@@ -11,6 +17,93 @@ class ChartGenerationError(Exception):
     """Custom exception for chart generation errors."""
 
 
+# The renderers live at module level with plain picklable arguments so
+# they can run inside worker processes. Each process lazily builds one
+# figure/axes pair and reuses it for every chart it renders: backend and
+# font setup happen once per worker, not once per chart.
+_FIG = None
+_AX = None
+
+
+def _prepare_axes(width: float, height: float) -> plt.Axes:
+    """Return the per-process shared axes, cleared and resized."""
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=(width, height))
+    else:
+        _FIG.set_size_inches(width, height)
+        _AX.clear()
+    return _AX
+
+
+def _save(path: Path) -> None:
+    # bbox_inches="tight" replaces the per-figure tight_layout pass
+    _FIG.savefig(path, bbox_inches="tight")
+
+
+def _render_customers_by_segment(df: pd.DataFrame, output_dir: Path) -> Path:
+    path = output_dir / "customers_by_segment.png"
+
+    ax = _prepare_axes(8, 5)
+    ax.bar(df["rfm_segment"], df["customers"])
+    ax.set_title("Customers by RFM Segment")
+    ax.set_xlabel("Segment")
+    ax.set_ylabel("Number of Customers")
+    ax.tick_params(axis="x", rotation=45)
+    _save(path)
+
+    return path
+
+
+def _render_customers_by_churn_risk(series: pd.Series, output_dir: Path) -> Path:
+    path = output_dir / "customers_by_churn_risk.png"
+
+    ax = _prepare_axes(6, 4)
+    ax.bar(series.index.astype(str), series.values)
+    ax.set_title("Customers by Churn Risk")
+    ax.set_xlabel("Churn Risk")
+    ax.set_ylabel("Number of Customers")
+    _save(path)
+
+    return path
+
+
+def _render_recency_vs_frequency(df: pd.DataFrame, output_dir: Path) -> Path:
+    path = output_dir / "recency_vs_frequency.png"
+
+    ax = _prepare_axes(8, 6)
+    ax.scatter(df["recency"], df["frequency"], alpha=0.6)
+    ax.set_title("Recency vs Frequency")
+    ax.set_xlabel("Recency (days)")
+    ax.set_ylabel("Frequency")
+    _save(path)
+
+    return path
+
+
+def _render_monetary_by_segment(df: pd.DataFrame, output_dir: Path) -> Path:
+    path = output_dir / "monetary_by_segment.png"
+
+    ax = _prepare_axes(8, 5)
+    ax.bar(df["rfm_segment"], df["monetary"])
+    ax.set_title("Total Monetary Value by Segment")
+    ax.set_xlabel("Segment")
+    ax.set_ylabel("Total Monetary Value")
+    ax.tick_params(axis="x", rotation=45)
+    _save(path)
+
+    return path
+
+
+# KPI key -> renderer, in report order
+_RENDERERS = {
+    "customers_by_segment": _render_customers_by_segment,
+    "customers_by_churn_risk": _render_customers_by_churn_risk,
+    "recency_vs_frequency": _render_recency_vs_frequency,
+    "monetary_by_segment": _render_monetary_by_segment,
+}
+
+
 class ChartsGenerator:
     """
     Generates charts for RFM customer analysis based on precomputed KPIs.
@@ -26,27 +119,23 @@ class ChartsGenerator:
         self.logger.info("Starting RFM chart generation")
 
         try:
-            charts = {}
-
-            if "customers_by_segment" in kpis:
-                charts["customers_by_segment"] = self._customers_by_segment(
-                    kpis["customers_by_segment"]
-                )
-
-            if "customers_by_churn_risk" in kpis:
-                charts["customers_by_churn_risk"] = self._customers_by_churn_risk(
-                    kpis["customers_by_churn_risk"]
-                )
-
-            if "recency_vs_frequency" in kpis:
-                charts["recency_vs_frequency"] = self._recency_vs_frequency(
-                    kpis["recency_vs_frequency"]
-                )
-
-            if "monetary_by_segment" in kpis:
-                charts["monetary_by_segment"] = self._monetary_by_segment(
-                    kpis["monetary_by_segment"]
-                )
+            # The charts have no cross-dependencies, so they render in
+            # parallel worker processes (matplotlib is not thread-safe);
+            # wall time is bounded by the slowest single chart.
+            tasks = [
+                (key, renderer)
+                for key, renderer in _RENDERERS.items()
+                if key in kpis
+            ]
+            if not tasks:
+                return {}
+
+            with ProcessPoolExecutor(max_workers=min(4, len(tasks))) as executor:
+                futures = {
+                    key: executor.submit(renderer, kpis[key], self.output_dir)
+                    for key, renderer in tasks
+                }
+                charts = {key: future.result() for key, future in futures.items()}
 
             self.logger.info("Successfully generated %d charts", len(charts))
             return charts
@@ -54,61 +143,3 @@ class ChartsGenerator:
         except Exception as exc:
             self.logger.error("Error generating charts: %s", exc)
             raise ChartGenerationError(str(exc)) from exc
-
-    def _customers_by_segment(self, df: pd.DataFrame) -> Path:
-        path = self.output_dir / "customers_by_segment.png"
-
-        plt.figure(figsize=(8, 5))
-        plt.bar(df["rfm_segment"], df["customers"])
-        plt.title("Customers by RFM Segment")
-        plt.xlabel("Segment")
-        plt.ylabel("Number of Customers")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(path)
-        plt.close()
-
-        return path
-
-    def _customers_by_churn_risk(self, series: pd.Series) -> Path:
-        path = self.output_dir / "customers_by_churn_risk.png"
-
-        plt.figure(figsize=(6, 4))
-        plt.bar(series.index.astype(str), series.values)
-        plt.title("Customers by Churn Risk")
-        plt.xlabel("Churn Risk")
-        plt.ylabel("Number of Customers")
-        plt.tight_layout()
-        plt.savefig(path)
-        plt.close()
-
-        return path
-
-    def _recency_vs_frequency(self, df: pd.DataFrame) -> Path:
-        path = self.output_dir / "recency_vs_frequency.png"
-
-        plt.figure(figsize=(8, 6))
-        plt.scatter(df["recency"], df["frequency"], alpha=0.6)
-        plt.title("Recency vs Frequency")
-        plt.xlabel("Recency (days)")
-        plt.ylabel("Frequency")
-        plt.tight_layout()
-        plt.savefig(path)
-        plt.close()
-
-        return path
-
-    def _monetary_by_segment(self, df: pd.DataFrame) -> Path:
-        path = self.output_dir / "monetary_by_segment.png"
-
-        plt.figure(figsize=(8, 5))
-        plt.bar(df["rfm_segment"], df["monetary"])
-        plt.title("Total Monetary Value by Segment")
-        plt.xlabel("Segment")
-        plt.ylabel("Total Monetary Value")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(path)
-        plt.close()
-
-        return path
@@ -1,9 +1,46 @@
 """KPI Calculator Class"""
 
 from typing import Dict, Any
+
+import numpy as np
 import pandas as pd
+from numba import njit
+
 from logger import get_logger
 
+# Labels for the recency bands, in ascending-risk order; the jitted
+# counter below indexes its buckets in the same order.
+_CHURN_RISK_LABELS = ["Low Risk", "Medium Risk", "High Risk", "Very High Risk"]
+
+
+@njit(cache=True)
+def _churn_risk_counts(recency, customer_codes, n_customers):
+    """Distinct customers per recency band in one pass.
+
+    Bands follow pd.cut over (0, 30], (30, 90], (90, 180], (180, inf);
+    NaN or non-positive recency is skipped, matching cut's behaviour.
+    A per-band seen bitmap deduplicates customers without hash sets.
+    """
+    seen = np.zeros((4, n_customers), dtype=np.uint8)
+    counts = np.zeros(4, dtype=np.int64)
+    for i in range(recency.shape[0]):
+        r = recency[i]
+        if r > 180:
+            band = 3
+        elif r > 90:
+            band = 2
+        elif r > 30:
+            band = 1
+        elif r > 0:
+            band = 0
+        else:
+            continue
+        code = customer_codes[i]
+        if code >= 0 and seen[band, code] == 0:
+            seen[band, code] = 1
+            counts[band] += 1
+    return counts
+
 
 class KPICalculationError(Exception):
     """Custom exception for KPI calculation errors."""
@@ -17,6 +54,35 @@ class KPICalculator:
     def __init__(self, df: pd.DataFrame) -> None:
         self.df = df.copy()
         self.logger = get_logger(__name__)
+        # Shared grouped aggregates, computed lazily: most of the KPI
+        # helpers re-grouped the same customer_id / rfm_segment keys,
+        # rebuilding the hash table per KPI. Two fused aggregations now
+        # serve all of them.
+        self._customer_stats: pd.DataFrame | None = None
+        self._segment_stats: pd.DataFrame | None = None
+
+    def _customer_aggregates(self) -> pd.DataFrame:
+        """Per-customer recency range and peak monetary value."""
+        if self._customer_stats is None:
+            self._customer_stats = self.df.groupby("customer_id").agg(
+                recency_min=("recency", "min"),
+                recency_max=("recency", "max"),
+                monetary_max=("monetary", "max"),
+            )
+        return self._customer_stats
+
+    def _segment_aggregates(self) -> pd.DataFrame | None:
+        """Per-segment customer counts and monetary totals."""
+        if "rfm_segment" not in self.df.columns:
+            return None
+        if self._segment_stats is None:
+            self._segment_stats = self.df.groupby(
+                "rfm_segment", observed=True
+            ).agg(
+                customers=("customer_id", "nunique"),
+                monetary=("monetary", "sum"),
+            )
+        return self._segment_stats
 
     def calculate_all(self) -> Dict[str, Any]:
         """
@@ -29,6 +95,16 @@ class KPICalculator:
         """
         self.logger.info("Starting RFM KPI calculations")
         try:
+            # Group keys as categoricals: the groupbys below then work
+            # on small integer codes instead of hashing a Python string
+            # per row. rfm_segment usually arrives categorical already
+            # (pd.cut output); customer_id is a plain string column.
+            for key in ("customer_id", "rfm_segment"):
+                if key in self.df.columns and not isinstance(
+                    self.df[key].dtype, pd.CategoricalDtype
+                ):
+                    self.df[key] = self.df[key].astype("category")
+
             kpis = {
                 "total_customers": self._total_customers(),
                 "active_customers": self._active_customers(),
@@ -54,21 +130,21 @@ class KPICalculator:
 
     def _total_customers(self) -> int:
         """Total number of unique customers."""
-        return int(self.df["customer_id"].nunique())
+        return int(len(self._customer_aggregates()))
 
     def _active_customers(self) -> int:
         """
         Customers considered active.
         Assumes recency in days and threshold <= 90 days.
         """
-        return int(self.df[self.df["recency"] <= 90]["customer_id"].nunique())
+        return int((self._customer_aggregates()["recency_min"] <= 90).sum())
 
     def _churn_risk_customers(self) -> int:
         """
         Customers at risk of churn.
         Assumes recency > 180 days.
         """
-        return int(self.df[self.df["recency"] > 180]["customer_id"].nunique())
+        return int((self._customer_aggregates()["recency_max"] > 180).sum())
 
     def _avg_recency(self) -> float:
         """Average recency in days."""
@@ -92,12 +168,13 @@ class KPICalculator:
             Index: segment
             Value: number of customers
         """
-        if "rfm_segment" not in self.df.columns:
+        segments = self._segment_aggregates()
+        if segments is None:
             return pd.Series(dtype=int)
 
         return (
-            self.df.groupby("rfm_segment", observed=True)["customer_id"]
-            .nunique()
+            segments["customers"]
+            .rename("customer_id")
             .sort_values(ascending=False)
             .head(1)
         )
@@ -113,8 +190,8 @@ class KPICalculator:
             Value: monetary value
         """
         return (
-            self.df.groupby("customer_id")["monetary"]
-            .max()
+            self._customer_aggregates()["monetary_max"]
+            .rename("monetary")
             .sort_values(ascending=False)
             .head(1)
         )
@@ -128,14 +205,13 @@ class KPICalculator:
         pd.DataFrame
             Columns: ['rfm_segment', 'customers']
         """
-        if "rfm_segment" not in self.df.columns:
+        segments = self._segment_aggregates()
+        if segments is None:
             return pd.DataFrame(columns=["rfm_segment", "customers"])
 
         return (
-            self.df.groupby("rfm_segment", observed=True)["customer_id"]
-            .nunique()
+            segments["customers"]
             .reset_index()
-            .rename(columns={"customer_id": "customers"})
             .sort_values("customers", ascending=False)
         )
 
@@ -149,14 +225,27 @@ class KPICalculator:
             Index: churn risk level
             Value: number of customers
         """
-        # Define churn risk based on recency
-        risk_levels = pd.cut(
-            self.df["recency"],
-            bins=[0, 30, 90, 180, float("inf")],
-            labels=["Low Risk", "Medium Risk", "High Risk", "Very High Risk"],
+        # One jitted scan over (recency, customer) replaces pd.cut plus
+        # a groupby nunique: banding and per-band customer dedup happen
+        # in the same pass.
+        codes, uniques = pd.factorize(self.df["customer_id"])
+        counts = _churn_risk_counts(
+            self.df["recency"].to_numpy(dtype=np.float64), codes, len(uniques)
         )
 
-        return self.df.groupby(risk_levels, observed=True)["customer_id"].nunique()
+        # Mirror the observed=True groupby result: only non-empty bands,
+        # keyed by the band labels in ascending-risk order.
+        observed = counts > 0
+        return pd.Series(
+            counts[observed],
+            index=pd.CategoricalIndex(
+                np.array(_CHURN_RISK_LABELS)[observed],
+                categories=_CHURN_RISK_LABELS,
+                ordered=True,
+                name="recency",
+            ),
+            name="customer_id",
+        )
 
     def _recency_vs_frequency(self) -> pd.DataFrame:
         """
@@ -178,12 +267,12 @@ class KPICalculator:
         pd.DataFrame
             Columns: ['rfm_segment', 'monetary']
         """
-        if "rfm_segment" not in self.df.columns:
+        segments = self._segment_aggregates()
+        if segments is None:
             return pd.DataFrame(columns=["rfm_segment", "monetary"])
 
         return (
-            self.df.groupby("rfm_segment", observed=True)["monetary"]
-            .sum()
+            segments["monetary"]
             .reset_index()
             .sort_values("monetary", ascending=False)
         )